@@ -222,11 +222,31 @@ class ResultCard:
         except Exception as ex:
             print(f"Error opening CV file: {ex}")
             
-    def _create_card(self):
-        """Create the CV card container"""
-        
+    def set_applicant(self, applicant_id, detail_id, name, matched_keywords, keywords_data, cv_path, bgcolor="#E3F2FD"):
+        """
+        Show another applicant in this card. The controls are kept and only their values change,
+        the keyword rows are rebuilt only when the keywords differ, so reusing a card for the
+        next search sends just the differences on the next page update.
+        """
+        if keywords_data != self.keywords_data:
+            self.keywords_column.controls = self._create_keyword_widgets(keywords_data)
+            self.keywords_column.scroll = ft.ScrollMode.HIDDEN if len(keywords_data) > 3 else None
+        self.applicant_id = applicant_id
+        self.detail_id = detail_id
+        self.name = name
+        self.matched_keywords = matched_keywords
+        self.keywords_data = keywords_data
+        self.cv_path = cv_path
+        self.bgcolor = bgcolor
+
+        self.name_text.value = name
+        self.matched_text.value = f"{matched_keywords} matched keyword{'s' if matched_keywords != 1 else ''}"
+        self.container.bgcolor = bgcolor
+
+    def _create_keyword_widgets(self, keywords_data):
+        """One row per keyword with its occurrence count"""
         keyword_widgets = []
-        for i, keyword_data in enumerate(self.keywords_data, 1):
+        for i, keyword_data in enumerate(keywords_data, 1):
             keyword_widgets.append(
                 ft.Row([
                     ft.Text(f"{i}. {keyword_data['keyword']}:", size=14, color="#000000", expand=True),
@@ -239,22 +259,32 @@ class ResultCard:
                     ),
                 ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
             )
+        return keyword_widgets
+
+    def _create_card(self):
+        """Create the CV card container"""
+        
+        keyword_widgets = self._create_keyword_widgets(self.keywords_data)
         
+        self.keywords_column = ft.Column(
+            controls=keyword_widgets,
+            spacing=5,
+            scroll=ft.ScrollMode.HIDDEN if len(keyword_widgets) > 3 else None
+        )
         keywords_section = ft.Container(
-            content=ft.Column(
-                controls=keyword_widgets,
-                spacing=5,
-                scroll=ft.ScrollMode.HIDDEN if len(keyword_widgets) > 3 else None
-            ),
+            content=self.keywords_column,
             height=105,
             padding=ft.padding.symmetric(vertical=5),
         )
         
+        self.name_text = ft.Text(self.name, size=20, weight=ft.FontWeight.BOLD, color="#424242")
+        self.matched_text = ft.Text(f"{self.matched_keywords} matched keyword{'s' if self.matched_keywords != 1 else ''}", 
+                                    size=14, color="#666666")
+        
         return ft.Container(
             content=ft.Column([
-                ft.Text(self.name, size=20, weight=ft.FontWeight.BOLD, color="#424242"),
-                ft.Text(f"{self.matched_keywords} matched keyword{'s' if self.matched_keywords != 1 else ''}", 
-                        size=14, color="#666666"),
+                self.name_text,
+                self.matched_text,
                 
                 ft.Container(height=10),
                 keywords_section,
@@ -1,10 +1,21 @@
 import flet as ft
 from .result_card import ResultCard
 
+# Cards rendered per page, a multiple of the 4 cards in a row
+RESULTS_PAGE_SIZE = 20
+
 class Results:
     def __init__(self, on_summary_click=None):
         self.on_summary_click = on_summary_click
         self.container = self._create_results_container()
+        self.applicants = []  # every result of the current search
+        self.shown = 0  # how many of them have a card on the page
+        self.page_limit = RESULTS_PAGE_SIZE
+        self.done = False
+        # Controls reused from one search to the next
+        self.cards = []
+        self.card_rows = []
+        self.no_results_row = None
         
         self.sample_data = {
             "exact_match_stats": {
@@ -104,6 +115,7 @@ class Results:
                             content=ft.Column([
                                 ft.Text("Exact Match: 15 CVs scanned in 45ms.", color="#4A90E2", size=14),
                                 ft.Text("Fuzzy Match: 8 CVs scanned in 78ms.", color="#9C27B0", size=14),
+                                ft.Text("", color="#757575", size=14, visible=False),  # coverage while CVs are loading
                             ]),
                             padding=ft.padding.all(15),
                             bgcolor="#E3F2FD",
@@ -120,6 +132,14 @@ class Results:
                     content=ft.Column([], spacing=15),  # Empty initially
                     padding=ft.padding.symmetric(horizontal=20, vertical=10),
                 ),
+                
+                # Next page of cards, also loaded when scrolling to the bottom
+                ft.Container(
+                    content=ft.OutlinedButton(text="Show more", on_click=self.load_more),
+                    alignment=ft.alignment.center,
+                    padding=ft.padding.only(bottom=20),
+                    visible=False,
+                ),
             ]),
             border_radius=10,
             bgcolor="white",
@@ -150,6 +170,8 @@ class Results:
         {
             "exact_match_stats": {"count": int, "time_ms": int},
             "fuzzy_match_stats": {"count": int, "time_ms": int},
+            "coverage": {"ready": bool, "searched": int, "total": int} (optional),
+            "partial": bool (optional, True when the search stopped at its deadline),
             "applicants": [
                 {
                     "applicant_id": int,
@@ -163,7 +185,24 @@ class Results:
         """
         if results_data is None:
             results_data = self.sample_data
-        
+
+        self.clear_results()
+        self.append_results(results_data, done=True)
+
+    def clear_results(self):
+        """Forget the previous search before its first batch; the cards are kept for reuse"""
+        self.applicants = []
+        self.shown = 0
+        self.page_limit = RESULTS_PAGE_SIZE
+        self.done = False
+
+    def append_results(self, results_data, done=False):
+        """
+        Add one batch of a streamed search (same format as show_results, "applicants" holding
+        only the new ones) and refresh the stats. Only the first page of cards is rendered,
+        load_more() renders the next one. Once done and nothing was found, the no-results
+        card is shown.
+        """
         exact_stats = results_data.get("exact_match_stats", {})
         fuzzy_stats = results_data.get("fuzzy_match_stats", {})
         
@@ -171,100 +210,137 @@ class Results:
         fuzzy_text = f"Fuzzy Match: {fuzzy_stats.get('count', 0)} CVs scanned in {fuzzy_stats.get('time_ms', 0)}ms."
         
         self.update_stats(exact_text, fuzzy_text)
+        self.update_coverage(results_data.get("coverage"), results_data.get("partial", False))
 
-        card_rows = []
-        applicants = results_data.get("applicants", [])
+        self.applicants.extend(results_data.get("applicants", []))
+        self.done = done
+        self._render()
+        self.container.visible = True
 
-        # If no applicants found
-        if(len(applicants) == 0):
-            no_results_container = ft.Container(
-                content=ft.Column([
-                    ft.Container(
-                        content=ft.Icon(
-                            ft.Icons.SEARCH_OFF,
-                            size=80,
-                            color="#B0BEC5"
-                        ),
-                        alignment=ft.alignment.center,
-                        margin=ft.margin.only(bottom=20)
-                    ),
-                    
-                    ft.Text(
-                        "No Applicants Found",
-                        size=24,
-                        weight=ft.FontWeight.BOLD,
-                        color="#424242",
-                        text_align=ft.TextAlign.CENTER
-                    ),
-                    
-                    ft.Text(
-                        "We couldn't find any applicants matching your search criteria.",
-                        size=16,
-                        color="#757575",
-                        text_align=ft.TextAlign.CENTER
-                    ),
-                    
-                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                padding=ft.padding.all(40),
-                alignment=ft.alignment.center,
-                bgcolor="#FFFFFF",
-                border_radius=12,
-                border=ft.border.all(2, "#E3F2FD"),
-                shadow=ft.BoxShadow(
-                    spread_radius=1,
-                    blur_radius=10,
-                    color="#1A000000",
-                    offset=ft.Offset(0, 2)
-                ),
-                margin=ft.margin.symmetric(horizontal=40, vertical=20)
-            )
-            
-            card_rows.append(
-                ft.Row(
-                    controls=[no_results_container],
-                    alignment=ft.MainAxisAlignment.CENTER
-                )
-            )
-            
-            cards_column = self.container.content.controls[2].content
-            cards_column.controls = card_rows
-            self.container.visible = True
+    def has_more(self):
+        """True while some results are not rendered yet"""
+        return self.shown < len(self.applicants)
+
+    def load_more(self, e=None):
+        """Render the next page of cards"""
+        if not self.has_more():
             return
-        
-        for i in range(0, len(applicants), 4):
-            applicant_chunk = applicants[i:i+4]
-            
-            row_cards = []
-            for applicant in applicant_chunk:
-                card = ResultCard(
-                    applicant_id=applicant["applicant_id"],
-                    detail_id=applicant["detail_id"],
-                    name=applicant["name"],
-                    matched_keywords=applicant["matched_keywords"],
-                    keywords_data=applicant["keywords_data"],
-                    bgcolor=self.calculate_color(applicant["applicant_id"], i),
-                    cv_path=applicant.get("cv_path", ""),
-                    on_summary_click=self.on_summary_click
-                )
+        self.page_limit += RESULTS_PAGE_SIZE
+        self._render()
+        if e is not None:
+            self.container.update()
+
+    def _render(self):
+        """
+        Lay the visible cards out in rows of 4. Cards and rows come from pools kept across
+        searches: the card at each position is given its new applicant in place, so a new
+        search only changes values of existing controls instead of building a new tree.
+        """
+        visible = min(len(self.applicants), self.page_limit)
+        for k in range(self.shown, visible):
+            applicant = self.applicants[k]
+            i = k - k % 4  # index of the row's first card
+            fields = dict(
+                applicant_id=applicant["applicant_id"],
+                detail_id=applicant["detail_id"],
+                name=applicant["name"],
+                matched_keywords=applicant["matched_keywords"],
+                keywords_data=applicant["keywords_data"],
+                bgcolor=self.calculate_color(applicant["applicant_id"], i),
+                cv_path=applicant.get("cv_path", ""),
+            )
+            if k < len(self.cards):
+                self.cards[k].set_applicant(**fields)
+            else:
+                card = ResultCard(on_summary_click=self.on_summary_click, **fields)
                 card.container.expand = True
-                row_cards.append(card.container)
-            
-            card_row = ft.Row(
-                controls=row_cards,
+                self.cards.append(card)
+        self.shown = visible
+
+        row_count = (visible + 3) // 4
+        while len(self.card_rows) < row_count:
+            self.card_rows.append(ft.Row(
+                controls=[],
                 spacing=15,
                 alignment=ft.MainAxisAlignment.START, 
-            )
-            card_rows.append(card_row)
-        
+            ))
+        for r in range(row_count):
+            self.card_rows[r].controls = [card.container for card in self.cards[4 * r:min(4 * r + 4, visible)]]
+
         cards_column = self.container.content.controls[2].content
-        cards_column.controls = card_rows
-        
-        self.container.visible = True
+        cards_column.controls = self.card_rows[:row_count]
+        # If no applicants found
+        if self.done and not self.applicants:
+            if self.no_results_row is None:
+                self.no_results_row = ft.Row(
+                    controls=[self._create_no_results_container()],
+                    alignment=ft.MainAxisAlignment.CENTER
+                )
+            cards_column.controls.append(self.no_results_row)
+
+        more_button = self.container.content.controls[3]
+        more_button.visible = self.has_more()
+        more_button.content.text = f"Show more ({len(self.applicants) - self.shown} left)"
+
+    def _create_no_results_container(self):
+        """Card shown when a search found no applicants"""
+        return ft.Container(
+            content=ft.Column([
+                ft.Container(
+                    content=ft.Icon(
+                        ft.Icons.SEARCH_OFF,
+                        size=80,
+                        color="#B0BEC5"
+                    ),
+                    alignment=ft.alignment.center,
+                    margin=ft.margin.only(bottom=20)
+                ),
+                
+                ft.Text(
+                    "No Applicants Found",
+                    size=24,
+                    weight=ft.FontWeight.BOLD,
+                    color="#424242",
+                    text_align=ft.TextAlign.CENTER
+                ),
+                
+                ft.Text(
+                    "We couldn't find any applicants matching your search criteria.",
+                    size=16,
+                    color="#757575",
+                    text_align=ft.TextAlign.CENTER
+                ),
+                
+            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+            padding=ft.padding.all(40),
+            alignment=ft.alignment.center,
+            bgcolor="#FFFFFF",
+            border_radius=12,
+            border=ft.border.all(2, "#E3F2FD"),
+            shadow=ft.BoxShadow(
+                spread_radius=1,
+                blur_radius=10,
+                color="#1A000000",
+                offset=ft.Offset(0, 2)
+            ),
+            margin=ft.margin.symmetric(horizontal=40, vertical=20)
+        )
     
     def hide_results(self):
         """Hide the results container"""
         self.container.visible = False
     
+    def update_coverage(self, coverage=None, partial=False):
+        """Show how many CVs were searched while they are still loading, and if the search was cut short"""
+        coverage_text = self.container.content.controls[1].content.controls[0].content.controls[2]
+        notes = []
+        if coverage and not coverage.get("ready", True):
+            notes.append(f"Still loading CVs: searched {coverage.get('searched', 0)} of {coverage.get('total', 0)}.")
+        if partial:
+            notes.append("Search stopped at its time limit, showing the results found so far.")
+        coverage_text.value = " ".join(notes)
+        coverage_text.visible = bool(notes)
+
     def update_stats(self, exact_match_info="", fuzzy_match_info=""):
         """Update the stats section"""
         stats_container = self.container.content.controls[1].content.controls[0].content
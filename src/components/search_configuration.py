@@ -4,12 +4,14 @@ class SearchConfiguration:
     def __init__(self, on_search_callback=None):
         self.on_search_callback = on_search_callback
         self.is_searching = False
+        self.search_generation = 0  # bumped by every search, only the latest one resets the button
         # Create components
         self.algorithms = ft.SegmentedButton(
             segments=[
                 ft.Segment(value="Knuth-Morris-Pratt", label=ft.Text("Knuth-Morris-Pratt", size=14)),
                 ft.Segment(value="Boyer-Moore", label=ft.Text("Boyer-Moore", size=14)),
                 ft.Segment(value="Aho-Corasick", label=ft.Text("Aho-Corasick", size=14)),
+                ft.Segment(value="Inverted-Index", label=ft.Text("Inverted Index", size=14)),
             ],
             selected={"Knuth-Morris-Pratt"},
             show_selected_icon=False,
@@ -124,9 +126,7 @@ class SearchConfiguration:
             ], spacing=10, alignment=ft.MainAxisAlignment.CENTER)
         
     async def _on_search_clicked(self, e):
-        if self.is_searching:
-            return
-        
+        # A new search while one is running replaces it: the service cancels the old one
         if self.on_search_callback:
             if(self.keywords_field.value == "" or self.top_matches.value == ""):
                 return
@@ -142,18 +142,20 @@ class SearchConfiguration:
             }
             print(f"Search data: {search_data}")
             # Start loading
+            self.search_generation += 1
+            generation = self.search_generation
             self.is_searching = True
-            self.search_button.disabled = True
             self.search_button.content = self._create_search_button_content()
             e.page.update()
              
-            self.on_search_callback(search_data)
+            # Runs off the event loop, so the loading state repaints while searching
+            await self.on_search_callback(search_data)
                     
-            # Stop loading
-            self.is_searching = False
-            self.search_button.disabled = False
-            self.search_button.content = self._create_search_button_content()
-            e.page.update()
+            # Stop loading, unless a newer search is still running
+            if generation == self.search_generation:
+                self.is_searching = False
+                self.search_button.content = self._create_search_button_content()
+                e.page.update()
             
     # def get_values(self):
     #     """Get current form values"""
@@ -1,4 +1,6 @@
-from collections import deque, defaultdict
+from array import array
+from collections import deque, defaultdict, OrderedDict
+from functools import cached_property
 # --- algorithms for searching and matching patterns in text ---
 
 # --- Knuth-Morris-Pratt (KMP) algorithm ---
@@ -15,30 +17,37 @@ def border_function(pattern: str) -> list:
         boders[i] = j
     return boders
 
-def knuth_morris_pratt(text: str, keywords: list[str]) -> list[dict]:
+def kmp_count(text: str, keyword: str, border: list) -> int:
+    """Count (overlapping) occurrences of keyword in text using its precomputed border table"""
+    j = 0
+    count = 0
+    m = len(keyword)
+    
+    for char in text:
+        while j > 0 and char != keyword[j]:
+            j = border[j - 1]
+        if char == keyword[j]:
+            j += 1
+        if j == m:
+            count += 1
+            j = border[j - 1]
+    
+    return count
+
+def knuth_morris_pratt(text: str, keywords) -> list[dict]:
+    """
+    keywords is a list of strings or a PatternSet compiled once per search.
+    Newlines in text match a space, like every matcher in this module.
+    """
     if not keywords:
         return []
+    text = text.replace('\n', ' ')
     results = []
-    for keyword in keywords:
-        if not keyword:
-            continue
-            
-        border = border_function(keyword)
-        j = 0
-        count = 0
-        
-        for i in range(len(text)):
-            while j > 0 and text[i] != keyword[j]:
-                j = border[j - 1]
-            if text[i] == keyword[j]:
-                j += 1
-            if j == len(keyword):
-                count += 1
-                j = border[j - 1]
-        
+    for pattern in compile_patterns(keywords):
+        count = kmp_count(text, pattern.keyword, pattern.border)
         if count == 0:
             continue
-        results.append({"keyword": keyword, "occurrences": count})
+        results.append({"keyword": pattern.keyword, "occurrences": count})
     
     return results
 
@@ -51,42 +60,210 @@ def get_last_occ(pattern: str) -> dict:
     return last_occurrence
 
 
-def boyer_moore(text: str, keywords: list[str]) -> list[dict]:
+def bm_count(text: str, keyword: str, last_occurence: dict) -> int:
+    """Bad-character only Boyer-Moore: count (overlapping) occurrences of keyword in text"""
+    i = 0
+    count = 0
+    m = len(keyword)
+    
+    while i <= len(text) - m:
+        j = m - 1
+
+        while j >= 0 and text[i + j] == keyword[j]:
+            j -= 1
+        
+        if j < 0:
+            count += 1
+            i += 1  
+        else:
+            mismatch_char = text[i + j]
+            last = last_occurence.get(mismatch_char, -1)
+            i += max(1, j - last)
+    
+    return count
+
+def good_suffix_shift(pattern: str) -> list:
+    """
+    Strong good-suffix table. shift[j + 1] is the safe shift after a mismatch at pattern[j],
+    shift[0] is the shift after a full match (the period of the pattern).
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+
+    # Case 1: the matched suffix occurs elsewhere in the pattern, preceded by a different char
+    i, j = m, m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+
+    # Case 2: only a prefix of the pattern matches a part of the matched suffix
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return shift
+
+def bm_full_count(text: str, keyword: str, last_occurence: dict, good_suffix: list) -> int:
+    """
+    Boyer-Moore with bad-character and strong good-suffix rules. After a match the pattern
+    shifts by its period and, by Galil's rule, only the part not already known to match is compared.
+    """
+    i = 0
+    count = 0
+    m = len(keyword)
+    n = len(text)
+    period = good_suffix[0]
+    known = 0  # keyword[:known] is known to match text[i:i + known]
+
+    while i <= n - m:
+        j = m - 1
+
+        while j >= known and text[i + j] == keyword[j]:
+            j -= 1
+        
+        if j < known:
+            count += 1
+            i += period
+            known = m - period
+        else:
+            bad_character = j - last_occurence.get(text[i + j], -1)
+            suffix_shift = good_suffix[j + 1]
+            i += bad_character if bad_character > suffix_shift else suffix_shift
+            known = 0
+    
+    return count
+
+def horspool_shift(pattern: str) -> dict:
+    """Horspool shift per character: distance from its last occurrence in pattern[:-1] to the end"""
+    m = len(pattern)
+    return {char: m - 1 - i for i, char in enumerate(pattern[:-1])}
+
+def horspool_count(text: str, keyword: str, shift: dict) -> int:
+    """Boyer-Moore-Horspool: shift on the text character under the last pattern position"""
+    i = 0
+    count = 0
+    m = len(keyword)
+    n = len(text)
+    
+    while i <= n - m:
+        if text[i:i + m] == keyword:
+            count += 1
+        i += shift.get(text[i + m - 1], m)
+    
+    return count
+
+def sunday_shift(pattern: str) -> dict:
+    """Sunday (quick search) shift per character: distance from its last occurrence to one past the end"""
+    m = len(pattern)
+    return {char: m - i for i, char in enumerate(pattern)}
+
+def sunday_count(text: str, keyword: str, shift: dict) -> int:
+    """Sunday's quick search: shift on the text character just after the current window"""
+    i = 0
+    count = 0
+    m = len(keyword)
+    n = len(text)
+    
+    while i <= n - m:
+        if text[i:i + m] == keyword:
+            count += 1
+        if i + m >= n:
+            break
+        i += shift.get(text[i + m], m + 1)
+    
+    return count
+
+BM_VARIANTS = ("full", "bad-character", "horspool", "sunday")
+
+def boyer_moore(text: str, keywords, variant: str = "full") -> list[dict]:
+    """
+    keywords is a list of strings or a PatternSet compiled once per search.
+    variant selects the shift rules: "full" (bad-character + good-suffix), "bad-character",
+    "horspool" or "sunday". All variants count overlapping occurrences.
+    Newlines in text match a space.
+    """
     if not keywords:
         return []
+    if variant not in BM_VARIANTS:
+        raise ValueError(f"Unknown Boyer-Moore variant: {variant}")
+    text = text.replace('\n', ' ')
     
     results = []
     
-    for keyword in keywords:
-        if not keyword:
-            continue
-            
-        last_occurence = get_last_occ(keyword)
-        i = 0
-        count = 0
-        
-        while i <= len(text) - len(keyword):
-            j = len(keyword) - 1
-
-            while j >= 0 and text[i + j] == keyword[j]:
-                j -= 1
-            
-            if j < 0:
-                count += 1
-                i += 1  
-            else:
-                mismatch_char = text[i + j]
-                last = last_occurence.get(mismatch_char, -1)
-                i += max(1, j - last)
-        
+    for pattern in compile_patterns(keywords):
+        if variant == "full":
+            count = bm_full_count(text, pattern.keyword, pattern.last_occ, pattern.good_suffix)
+        elif variant == "bad-character":
+            count = bm_count(text, pattern.keyword, pattern.last_occ)
+        elif variant == "horspool":
+            count = horspool_count(text, pattern.keyword, pattern.horspool_shift)
+        else:
+            count = sunday_count(text, pattern.keyword, pattern.sunday_shift)
         if count == 0:
             continue
 
-        results.append({"keyword": keyword, "occurrences": count})
+        results.append({"keyword": pattern.keyword, "occurrences": count})
     
     return results
 
 
+# --- Compiled pattern sets ---
+class CompiledPattern:
+    """A keyword with its preprocessing tables, each computed on first use"""
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+
+    @cached_property
+    def border(self) -> list:
+        return border_function(self.keyword)
+
+    @cached_property
+    def last_occ(self) -> dict:
+        return get_last_occ(self.keyword)
+
+    @cached_property
+    def good_suffix(self) -> list:
+        return good_suffix_shift(self.keyword)
+
+    @cached_property
+    def horspool_shift(self) -> dict:
+        return horspool_shift(self.keyword)
+
+    @cached_property
+    def sunday_shift(self) -> dict:
+        return sunday_shift(self.keyword)
+
+
+class PatternSet:
+    """
+    Keywords compiled once per search and passed to the per-document matchers,
+    so KMP/Boyer-Moore preprocessing runs once per keyword instead of once per CV.
+    """
+    def __init__(self, keywords: list[str]):
+        self.keywords = [k for k in keywords if k]
+        self.patterns = [CompiledPattern(k) for k in self.keywords]
+
+    def __iter__(self):
+        return iter(self.patterns)
+
+    def __len__(self):
+        return len(self.patterns)
+
+def compile_patterns(keywords) -> PatternSet:
+    """Return keywords as a PatternSet, compiling them if needed"""
+    if isinstance(keywords, PatternSet):
+        return keywords
+    return PatternSet(keywords)
+
 
 def levenshtein_distance(a: str, b: str) -> float:
     """
@@ -118,7 +295,141 @@ def levenshtein_distance(a: str, b: str) -> float:
 
     return (1 - dp[m][n] / max(m, n)) * 100
 
-def fuzzy_match(text: str, keywords: list[str], threshold: float = 80.0) -> list[dict]:
+def max_edit_distance(m: int, n: int, threshold: float) -> int:
+    """
+    Largest edit distance between strings of lengths m and n whose match percentage
+    (as returned by levenshtein_distance) still reaches threshold. -1 if none can.
+    """
+    longest = max(m, n)
+    if longest == 0:
+        return 0 if threshold <= 100 else -1
+
+    # Start from a slightly loose bound and step down with the exact percentage formula,
+    # so the result agrees with levenshtein_distance down to float rounding
+    bound = min(longest, int((100 - threshold) * longest / 100) + 1)
+    while bound >= 0 and (1 - bound / longest) * 100 < threshold:
+        bound -= 1
+    return bound
+
+def bounded_levenshtein(a: str, b: str, max_dist: int) -> int:
+    """
+    Edit distance between a and b if it is at most max_dist, otherwise max_dist + 1.
+    Only the diagonal band of width 2 * max_dist + 1 is computed, keeping two rows,
+    and the computation stops as soon as a whole row exceeds max_dist.
+    """
+    m, n = len(a), len(b)
+    if abs(m - n) > max_dist:
+        return max_dist + 1
+    if m == 0 or n == 0:
+        return max(m, n)
+
+    over = max_dist + 1
+    prev = [j if j <= max_dist else over for j in range(n + 1)]
+    curr = [over] * (n + 1)
+
+    for i in range(1, m + 1):
+        lo = max(1, i - max_dist)
+        hi = min(n, i + max_dist)
+        curr[lo - 1] = i if lo == 1 else over
+        if hi < n:
+            curr[hi + 1] = over
+
+        row_min = curr[lo - 1]
+        char = a[i - 1]
+        for j in range(lo, hi + 1):
+            cost = prev[j - 1] + (char != b[j - 1])  # substitute
+            if prev[j] + 1 < cost:                    # delete
+                cost = prev[j] + 1
+            if curr[j - 1] + 1 < cost:                # insert
+                cost = curr[j - 1] + 1
+            curr[j] = cost
+            if cost < row_min:
+                row_min = cost
+
+        if row_min > max_dist:
+            return over
+        prev, curr = curr, prev
+
+    return prev[n] if prev[n] <= max_dist else over
+
+def is_fuzzy_match(word: str, keyword: str, threshold: float = 80.0) -> bool:
+    """Same decision as levenshtein_distance(word, keyword) >= threshold, with a bounded distance"""
+    max_dist = max_edit_distance(len(word), len(keyword), threshold)
+    if max_dist < 0:
+        return False
+    return bounded_levenshtein(word, keyword, max_dist) <= max_dist
+
+def myers_peq(pattern: str) -> dict:
+    """Match bit-vectors for Myers' algorithm: bit i of peq[c] is set when pattern[i] == c"""
+    peq = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
+
+def myers_distance(pattern: str, text: str, peq: dict = None) -> int:
+    """
+    Levenshtein distance between pattern and text with Myers/Hyyrö bit-parallel vectors.
+    Each column of the DP matrix is encoded as +1/-1 vertical delta bit-vectors, so every
+    character of text costs a fixed handful of integer operations. peq can be precomputed
+    with myers_peq(pattern) when the same pattern is compared against many texts.
+    """
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+    if peq is None:
+        peq = myers_peq(pattern)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = mask  # vertical +1 deltas
+    mv = 0     # vertical -1 deltas
+    score = m
+
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Row 0 of the edit distance matrix grows by one per column, hence the shifted-in 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
+
+def myers_similarity(a: str, b: str) -> float:
+    """Bit-parallel equivalent of levenshtein_distance: the matching percentage between a and b"""
+    m, n = len(a), len(b)
+    if m == 0:
+        return 100.0 if n == 0 else 0.0
+    return (1 - myers_distance(b, a) / max(m, n)) * 100
+
+FUZZY_BACKENDS = ("banded", "myers", "dp")
+
+def fuzzy_matcher(keyword: str, threshold: float = 80.0, backend: str = "banded"):
+    """
+    Return a predicate telling whether a lowercase word fuzzily matches keyword.
+    backend "banded" uses the threshold-bounded distance, "myers" the bit-parallel distance
+    and "dp" the full levenshtein_distance matrix. All three give the same matches.
+    """
+    if backend not in FUZZY_BACKENDS:
+        raise ValueError(f"Unknown fuzzy backend: {backend}")
+    keyword = keyword.lower()
+
+    if backend == "banded":
+        return lambda word: is_fuzzy_match(word, keyword, threshold)
+    if backend == "myers":
+        peq = myers_peq(keyword)
+        return lambda word: (1 - myers_distance(keyword, word, peq) / max(len(word), len(keyword))) * 100 >= threshold
+    return lambda word: levenshtein_distance(word, keyword) >= threshold
+
+def fuzzy_match(text: str, keywords: list[str], threshold: float = 80.0, backend: str = "banded") -> list[dict]:
     """
     Perform fuzzy matching of keywords in the text using Levenshtein distance.
     Returns a list of dictionaries with keyword and its occurrences.
@@ -127,24 +438,30 @@ def fuzzy_match(text: str, keywords: list[str], threshold: float = 80.0) -> list
         return []
     
     results = []
+    words = [word.lower() for word in text.split()]
     
     for keyword in keywords:
         if not keyword:
             continue
             
-        occurrences = 0
-        words = text.split()
-        
-        for word in words:
-            match_percentage = levenshtein_distance(word.lower(), keyword.lower())
-            if match_percentage >= threshold:
-                occurrences += 1
+        matches = fuzzy_matcher(keyword, threshold, backend)
+        occurrences = sum(1 for word in words if matches(word))
         
         if occurrences > 0:
             results.append({"keyword": keyword, "occurrences": occurrences})
     
     return results
 
+def fuzzy_match_tokens(tokens, keyword: str, threshold: float = 80.0, backend: str = "banded") -> list[str]:
+    """
+    Return the distinct lowercase tokens (e.g. a corpus vocabulary) that fuzzily match keyword,
+    so each (keyword, token) pair is scored once no matter how often the token occurs.
+    """
+    if not keyword:
+        return []
+    matches = fuzzy_matcher(keyword, threshold, backend)
+    return [token for token in tokens if matches(token)]
+
 
 class AhoCorasickNode:
     def __init__(self):
@@ -202,7 +519,8 @@ class AhoCorasick:
         matches = defaultdict(int)
         node = self.root
         
-        for i, char in enumerate(text.lower()):  # Case insensitive
+        # Case insensitive, a newline matches a space
+        for i, char in enumerate(text.lower().replace('\n', ' ')):
             # Follow failure links until we find a match or reach root
             while node is not None and char not in node.children:
                 node = node.failure
@@ -219,27 +537,227 @@ class AhoCorasick:
         
         return matches
 
-def aho_corasick(text: str, keywords: list) -> list:
+
+# Joins documents laid out in one buffer (see core.corpus); keywords never contain it
+DOCUMENT_SEPARATOR = "\x00"
+
+class AhoCorasickDFA:
+    """
+    Array-backed form of a built AhoCorasick automaton. Failure transitions are folded
+    into a full goto table stored in a flat array indexed by state row + char class,
+    so the scan is one table lookup per character with no failure-chasing loop.
+    Characters that do not appear in any keyword share class 0, which always leads back to root.
+    DOCUMENT_SEPARATOR has its own class leading to a boundary state that behaves like root,
+    so a scan over many joined documents can tell where each one ends.
+    A newline shares the class of the space, so texts are scanned with their line breaks kept.
+    """
+    def __init__(self, ac: AhoCorasick):
+        # Number states in BFS order so a state's failure target is always numbered first
+        nodes = [ac.root]
+        state_of = {id(ac.root): 0}
+        queue = deque([ac.root])
+        while queue:
+            node = queue.popleft()
+            for child in node.children.values():
+                state_of[id(child)] = len(nodes)
+                nodes.append(child)
+                queue.append(child)
+
+        alphabet = sorted({char for node in nodes for char in node.children} - {DOCUMENT_SEPARATOR})
+        self.char_class = {char: i + 1 for i, char in enumerate(alphabet)}
+        separator_class = len(alphabet) + 1
+        self.char_class[DOCUMENT_SEPARATOR] = separator_class
+        self.num_classes = num_classes = len(alphabet) + 2
+
+        # Transitions store the target's row (state * num_classes) so the scan needs no multiply.
+        # The boundary state is numbered after the trie states.
+        self.boundary_row = boundary_row = len(nodes) * num_classes
+        goto = array('i', [0]) * (boundary_row + num_classes)
+        for state, node in enumerate(nodes):
+            row = state * num_classes
+            failure_row = state_of[id(node.failure)] * num_classes if node.failure else 0
+            for char, cls in self.char_class.items():
+                child = node.children.get(char)
+                if child is not None and cls != separator_class:
+                    goto[row + cls] = state_of[id(child)] * num_classes
+                elif state != 0:
+                    goto[row + cls] = goto[failure_row + cls]
+            goto[row + separator_class] = boundary_row
+        goto[boundary_row:] = goto[0:num_classes]
+        self.goto = goto
+        if ' ' in self.char_class and '\n' not in self.char_class:
+            self.char_class['\n'] = self.char_class[' ']
+
+        # Output keyword ids per state: out_ids[out_start[s]:out_start[s + 1]]
+        self.keywords = []
+        keyword_id = {}
+        out_start = array('i', [0])
+        out_ids = array('i')
+        for node in nodes:
+            for keyword in node.output:
+                if keyword not in keyword_id:
+                    keyword_id[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                out_ids.append(keyword_id[keyword])
+            out_start.append(len(out_ids))
+        out_start.append(len(out_ids))  # boundary state has no output
+        self.out_start = out_start
+        self.out_ids = out_ids
+        # The boundary row is flagged like an output row so the scan loop catches it for free
+        self.output_rows = frozenset(
+            state * num_classes for state in range(len(nodes)) if out_start[state] != out_start[state + 1]
+        ) | {boundary_row}
+
+        # Byte translation table (latin-1 code point -> char class) for the fast scan.
+        # Unencodable characters are replaced by '?', so '?' must not be a keyword character.
+        self.byte_classes = None
+        if num_classes <= 256 and '?' not in self.char_class and all(ord(c) < 256 for c in alphabet):
+            table = bytearray(256)
+            for char, cls in self.char_class.items():
+                table[ord(char)] = cls
+            self.byte_classes = bytes(table)
+
+    def classes(self, text):
+        """Iterate over the char classes of text"""
+        if self.byte_classes is not None:
+            return text.encode('latin-1', 'replace').translate(self.byte_classes)
+        char_class = self.char_class.get
+        return (char_class(char, 0) for char in text)
+
+    def scan(self, text):
+        """Run the automaton over text, returning {state row: visit count} for output states"""
+        documents = self.scan_documents(text)
+        return documents[0] if len(documents) == 1 else self._merge(documents)
+
+    def scan_documents(self, text):
+        """
+        Run the automaton over documents joined by DOCUMENT_SEPARATOR in a single pass,
+        returning one {state row: visit count} per document
+        """
+        goto = self.goto
+        output_rows = self.output_rows
+        boundary_row = self.boundary_row
+        visits = defaultdict(int)
+        documents = [visits]
+        row = 0
+        for cls in self.classes(text):
+            row = goto[row + cls]
+            if row in output_rows:
+                if row == boundary_row:
+                    visits = defaultdict(int)
+                    documents.append(visits)
+                else:
+                    visits[row] += 1
+        return documents
+
+    @staticmethod
+    def _merge(documents):
+        merged = defaultdict(int)
+        for visits in documents:
+            for row, count in visits.items():
+                merged[row] += count
+        return merged
+
+    def expand(self, visits):
+        """Turn {state row: visit count} into {keyword: occurrences}"""
+        matches = defaultdict(int)
+        for row, count in visits.items():
+            state = row // self.num_classes
+            for i in range(self.out_start[state], self.out_start[state + 1]):
+                matches[self.keywords[self.out_ids[i]]] += count
+        return matches
+
+    def search(self, text):
+        """Search for all occurrences of keywords in text"""
+        return self.expand(self.scan(text.lower()))  # Case insensitive
+
+# --- Compiled automaton cache ---
+def normalize_keywords(keywords) -> tuple:
+    """
+    Normalize a keyword list into the key used to share compiled automata:
+    lowercased, empty entries removed, duplicates removed, sorted.
+    """
+    return tuple(sorted({k.lower() for k in keywords if k.strip()}))
+
+
+AC_ENGINES = ("trie", "dfa")
+
+class AutomatonCache:
+    """
+    LRU cache of compiled Aho-Corasick automata keyed by engine and normalized keyword set,
+    so one automaton is reused for every CV in a search and for repeated searches.
+    "trie" is the AhoCorasick object graph, "dfa" its array-backed AhoCorasickDFA form.
+    """
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._automata = OrderedDict()
+
+    def get(self, keywords, engine: str = "trie"):
+        """Return the compiled automaton for keywords, building it on a miss"""
+        if engine not in AC_ENGINES:
+            raise ValueError(f"Unknown Aho-Corasick engine: {engine}")
+        normalized = normalize_keywords(keywords)
+        key = (engine, normalized)
+        ac = self._automata.get(key)
+        if ac is not None:
+            self.hits += 1
+            self._automata.move_to_end(key)
+            return ac
+
+        self.misses += 1
+        ac = AhoCorasick()
+        ac.build_trie(normalized)
+        ac.build_failure_function()
+        if engine == "dfa":
+            ac = AhoCorasickDFA(ac)
+        self._automata[key] = ac
+        while len(self._automata) > self.max_size:
+            self._automata.popitem(last=False)
+            self.evictions += 1
+        return ac
+
+    def clear(self):
+        self._automata.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._automata),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+automaton_cache = AutomatonCache()
+
+def aho_corasick(text: str, keywords, engine: str = "dfa") -> list:
     if not keywords or not text:
         return []
+    if isinstance(keywords, PatternSet):
+        keywords = keywords.keywords
     
     # Filter out empty keywords
     keywords = [k for k in keywords if k.strip()]
     if not keywords:
         return []
     
-    # Build Aho-Corasick automaton
-    ac = AhoCorasick()
-    ac.build_trie(keywords)
-    ac.build_failure_function()
+    # Reuse the compiled automaton for this keyword set (trie is built on normalized keywords)
+    ac = automaton_cache.get(keywords, engine)
     
     # Search for patterns
     matches = ac.search(text)
     
-    # Format output
+    return format_matches(keywords, matches)
+
+def format_matches(keywords: list, matches: dict) -> list:
+    """Format {normalized keyword: occurrences} as keywords_data, in the order of keywords"""
     keywords_data = []
     for keyword in keywords:
-        occurrences = matches.get(keyword, 0)
+        occurrences = matches.get(keyword.lower(), 0)
         if occurrences != 0:
             keywords_data.append({
                 "keyword": keyword,
@@ -248,6 +766,41 @@ def aho_corasick(text: str, keywords: list) -> list:
     
     return keywords_data
 
+def aho_corasick_corpus(buffer: str, keywords) -> list:
+    """
+    Single-pass Aho-Corasick over a whole corpus laid out in one lowercase buffer, documents
+    joined by DOCUMENT_SEPARATOR (see core.corpus), newlines kept. The separator sends the automaton back to
+    root, so no match crosses a document boundary, and each hit is attributed to the document
+    being scanned. Returns keywords_data for every document, in buffer order.
+    """
+    keywords = [k for k in keywords if k.strip() and DOCUMENT_SEPARATOR not in k]
+    if not keywords:
+        return [[] for _ in range(buffer.count(DOCUMENT_SEPARATOR) + 1)]
+    
+    ac = automaton_cache.get(keywords, "dfa")
+    return [format_matches(keywords, ac.expand(visits)) for visits in ac.scan_documents(buffer)]
+
+# --- Matching many texts ---
+ALGORITHMS = {
+    "Knuth-Morris-Pratt": knuth_morris_pratt,
+    "Boyer-Moore": boyer_moore,
+    "Aho-Corasick": aho_corasick,
+}
+
+def search_texts(texts, keywords: list[str], algo: str):
+    """
+    Run the exact matcher named by algo over many texts with a single preprocessing step.
+    texts is an iterable of (key, text) pairs; yields (key, results) lazily, so callers
+    can stop consuming once they have enough matches.
+    """
+    matcher = ALGORITHMS.get(algo)
+    if matcher is None:
+        raise ValueError(f"Unknown algorithm: {algo}")
+
+    patterns = compile_patterns(keywords)
+    for key, text in texts:
+        yield key, matcher(text, patterns)
+
 # Example usage  
 # text = "I love React and Express. HTML and CSS are great with React."
 # keywords = ["React", "Express", "HTML", "CSS", "JavaScript"]
@@ -261,4 +814,4 @@ def aho_corasick(text: str, keywords: list) -> list:
 #     {"keyword": "HTML", "occurrences": 1},
 #     {"keyword": "CSS", "occurrences": 1},
 #     {"keyword": "JavaScript", "occurrences": 0}
-# ]
\ No newline at end of file
+# ]
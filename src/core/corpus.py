@@ -0,0 +1,128 @@
+from array import array
+from bisect import bisect_left
+from multiprocessing import shared_memory
+import struct
+from core.algorithm import aho_corasick_corpus, DOCUMENT_SEPARATOR
+
+# --- corpus laid out in one contiguous buffer ---
+
+# Characters scanned between two checks of should_stop
+SCAN_BLOCK_SIZE = 1 << 20
+
+
+class Corpus:
+    """
+    Every CV text laid out in one contiguous lowercase buffer, documents joined by DOCUMENT_SEPARATOR,
+    with a sorted array of document start offsets. The automaton runs over whole blocks of
+    documents at a time instead of one call per CV.
+    """
+    def __init__(self, documents: dict):
+        self.doc_ids = list(documents)
+        self.starts = array('q')
+        parts = []
+        position = 0
+        for text in documents.values():
+            text = text.lower().replace(DOCUMENT_SEPARATOR, " ")
+            self.starts.append(position)
+            parts.append(text)
+            position += len(text) + len(DOCUMENT_SEPARATOR)
+        self.buffer = DOCUMENT_SEPARATOR.join(parts)
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    def blocks(self, block_size: int = SCAN_BLOCK_SIZE):
+        """
+        Split the buffer into runs of whole documents of about block_size characters: yields
+        (index of the first document, text of the run with its documents joined by DOCUMENT_SEPARATOR)
+        """
+        count = len(self.starts)
+        first = 0
+        while first < count:
+            last = max(bisect_left(self.starts, self.starts[first] + block_size), first + 1)
+            end = self.starts[last] - len(DOCUMENT_SEPARATOR) if last < count else len(self.buffer)
+            yield first, self.buffer[self.starts[first]:end]
+            first = last
+
+    def aho_corasick(self, keywords: list[str], should_stop=None) -> dict:
+        """
+        Aho-Corasick pass over the corpus: {doc_id: keywords_data} for matching documents.
+        The buffer is scanned in blocks of documents; should_stop() is called before each block,
+        once it returns True the documents after it are left out.
+        """
+        results = {}
+        for first, block in self.blocks():
+            if should_stop is not None and should_stop():
+                break
+            for index, keywords_data in enumerate(aho_corasick_corpus(block, keywords), first):
+                if keywords_data:
+                    results[self.doc_ids[index]] = keywords_data
+        return results
+
+
+class SharedCorpus:
+    """
+    CV texts in one multiprocessing.shared_memory segment: a UTF-8 blob plus an offsets table.
+    Worker processes attach to the segment by name and read documents straight from the shared
+    pages instead of receiving pickled copies, so their memory stays flat as the corpus grows.
+    Layout (int64 values): count, doc_ids[count], offsets[count + 1], then the blob.
+    The process that created the segment owns it and unlinks it on close(); workers only detach.
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        count = struct.unpack_from('q', shm.buf, 0)[0]
+        table = array('q')
+        table.frombytes(bytes(shm.buf[8:8 + 8 * (2 * count + 1)]))
+        self.doc_ids = table[:count].tolist()
+        self.offsets = table[count:]
+        self.data_start = 8 + 8 * (2 * count + 1)
+        self.index = {doc_id: i for i, doc_id in enumerate(self.doc_ids)}
+
+    @classmethod
+    def create(cls, documents: dict) -> "SharedCorpus":
+        """Copy {doc_id (int): text} into a new shared memory segment"""
+        blobs = [text.encode('utf-8') for text in documents.values()]
+        table = array('q', documents.keys())
+        offset = 0
+        table.append(offset)
+        for blob in blobs:
+            offset += len(blob)
+            table.append(offset)
+
+        header = struct.pack('q', len(blobs)) + table.tobytes()
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(header) + offset))
+        shm.buf[:len(header)] = header
+        position = len(header)
+        for blob in blobs:
+            shm.buf[position:position + len(blob)] = blob
+            position += len(blob)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCorpus":
+        """Attach to a segment created by another process"""
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.index
+
+    def text(self, doc_id) -> str:
+        """Decode one document from the shared pages"""
+        i = self.index[doc_id]
+        start = self.data_start + self.offsets[i]
+        end = self.data_start + self.offsets[i + 1]
+        return str(self.shm.buf[start:end], 'utf-8')
+
+    def close(self):
+        """Detach from the segment; the owner also unlinks it"""
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
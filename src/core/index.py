@@ -0,0 +1,280 @@
+from collections import Counter
+import pickle
+from pathlib import Path
+from core.algorithm import fuzzy_match_tokens, max_edit_distance, myers_distance, myers_peq, border_function, kmp_count
+
+# --- indexes built over the extracted CV texts ---
+
+class Vocabulary:
+    """
+    Corpus-wide vocabulary: every distinct lowercase token (as produced by str.split)
+    with its occurrence count in each document. Fuzzy matching scores each distinct
+    token once and reads per-document occurrences from the postings.
+    """
+    def __init__(self):
+        self.postings = {}  # token -> {doc_id: count}
+        self.bktree = None  # optional BKTree over the tokens, used to retrieve fuzzy candidates
+
+    def add_document(self, doc_id, text: str):
+        """Add the tokens of a document"""
+        for token, count in Counter(word.lower() for word in text.split()).items():
+            self.postings.setdefault(token, {})[doc_id] = count
+
+    def __len__(self):
+        return len(self.postings)
+
+    def __contains__(self, token):
+        return token in self.postings
+
+    def occurrence_bounds(self, keywords: list[str], case_sensitive: bool = True) -> dict:
+        """
+        Upper bounds on the substring matches of keywords in each document:
+        {doc_id: (distinct keywords, total occurrences)}. Documents left out cannot match at all.
+        A keyword without whitespace lies inside a single token, so its bound is the overlapping
+        count over the tokens containing it. A phrase needs its first word to end a token.
+        """
+        bounds = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            keyword = keyword if case_sensitive else keyword.lower()
+            words = keyword.split()
+            if not words:
+                continue
+            per_document = Counter()
+
+            if keyword != keyword.strip():
+                # Leading/trailing whitespace: no cheap bound, every document stays a candidate
+                for documents in self.postings.values():
+                    for doc_id in documents:
+                        per_document[doc_id] = float('inf')
+            elif len(words) == 1:
+                border = border_function(keyword)
+                for token, documents in self.postings.items():
+                    if keyword in token:
+                        occurrences = kmp_count(token, keyword, border)
+                        for doc_id, count in documents.items():
+                            per_document[doc_id] += occurrences * count
+            else:
+                for token, documents in self.postings.items():
+                    if token.endswith(words[0]):
+                        per_document.update(documents)
+
+            for doc_id, count in per_document.items():
+                distinct, total = bounds.get(doc_id, (0, 0))
+                bounds[doc_id] = (distinct + 1, total + count)
+        return bounds
+
+    def fuzzy_tokens(self, keyword: str, threshold: float = 80.0, backend: str = "banded") -> list[str]:
+        """Distinct tokens that fuzzily match keyword, from the BK-tree when one is attached"""
+        if self.bktree is not None and threshold > 0:
+            return [token for token in self.bktree.fuzzy_search(keyword, threshold) if token in self.postings]
+        return fuzzy_match_tokens(self.postings, keyword, threshold, backend)
+
+    def fuzzy_search(self, keywords: list[str], threshold: float = 80.0, backend: str = "banded",
+                     should_stop=None) -> dict:
+        """
+        Fuzzy match keywords against the vocabulary.
+        Returns {doc_id: [{"keyword": str, "occurrences": int}]} with keywords in the given order,
+        identical to calling fuzzy_match on every document.
+        should_stop() is called before each keyword; once it returns True the rest are skipped.
+        """
+        results = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            if should_stop is not None and should_stop():
+                break
+            occurrences = Counter()
+            for token in self.fuzzy_tokens(keyword, threshold, backend):
+                occurrences.update(self.postings[token])
+            for doc_id, count in occurrences.items():
+                results.setdefault(doc_id, []).append({"keyword": keyword, "occurrences": count})
+        return results
+
+
+# Punctuation stripped from token edges; inner punctuation (node.js, c++, c#) is kept
+LEADING_PUNCTUATION = "([{\"'<"
+TRAILING_PUNCTUATION = ".,;:!?)]}\"'>"
+
+def normalize_token(token: str) -> str:
+    """Lowercase a whitespace token and strip surrounding punctuation"""
+    return token.lower().lstrip(LEADING_PUNCTUATION).rstrip(TRAILING_PUNCTUATION)
+
+
+class InvertedIndex:
+    """
+    Inverted index from normalized token to its postings {doc_id: [token positions]}.
+    Whole-word and phrase queries are answered from the postings in time proportional
+    to the matches, instead of rescanning every CV text.
+    """
+    def __init__(self):
+        self.postings = {}  # token -> {doc_id: [positions]}
+
+    def add_document(self, doc_id, text: str):
+        """Add the tokens of a document; positions are token ordinals in the document"""
+        position = 0
+        for word in text.split():
+            token = normalize_token(word)
+            if token:
+                self.postings.setdefault(token, {}).setdefault(doc_id, []).append(position)
+            position += 1
+
+    def __len__(self):
+        return len(self.postings)
+
+    def count(self, keyword: str) -> dict:
+        """Whole-word occurrences of keyword (a word or a phrase) per document: {doc_id: count}"""
+        tokens = [normalize_token(word) for word in keyword.split()]
+        tokens = [token for token in tokens if token]
+        if not tokens:
+            return {}
+
+        first = self.postings.get(tokens[0], {})
+        if len(tokens) == 1:
+            return {doc_id: len(positions) for doc_id, positions in first.items()}
+
+        # Phrase: every following token must appear at the next position in the same document
+        rest = [self.postings.get(token, {}) for token in tokens[1:]]
+        counts = {}
+        for doc_id, positions in first.items():
+            following = []
+            for postings in rest:
+                doc_positions = postings.get(doc_id)
+                if doc_positions is None:
+                    break
+                following.append(set(doc_positions))
+            else:
+                count = sum(
+                    1 for p in positions
+                    if all(p + offset in doc_positions for offset, doc_positions in enumerate(following, 1))
+                )
+                if count:
+                    counts[doc_id] = count
+        return counts
+
+    def search(self, keywords: list[str], should_stop=None) -> dict:
+        """
+        Whole-word search for keywords.
+        Returns {doc_id: [{"keyword": str, "occurrences": int}]} with keywords in the given order.
+        should_stop() is called before each keyword; once it returns True the rest are skipped.
+        """
+        results = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            if should_stop is not None and should_stop():
+                break
+            for doc_id, count in self.count(keyword).items():
+                results.setdefault(doc_id, []).append({"keyword": keyword, "occurrences": count})
+        return results
+
+
+def build_inverted_index(documents: dict) -> InvertedIndex:
+    """Build the inverted index of {doc_id: text}"""
+    index = InvertedIndex()
+    for doc_id, text in documents.items():
+        index.add_document(doc_id, text)
+    return index
+
+
+def build_vocabulary(documents: dict) -> Vocabulary:
+    """Build the vocabulary of {doc_id: text}"""
+    vocabulary = Vocabulary()
+    for doc_id, text in documents.items():
+        vocabulary.add_document(doc_id, text)
+    return vocabulary
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over tokens with the edit distance metric. A query for all tokens
+    within distance r of a word only descends into children whose edge distance lies in
+    [d - r, d + r], so it scores a small part of the vocabulary. Tokens can be added at any time.
+    """
+    def __init__(self):
+        self.root = None  # [token, {distance: child node}]
+        self.tokens = set()
+
+    def add(self, token: str):
+        if token in self.tokens:
+            return
+        self.tokens.add(token)
+        if self.root is None:
+            self.root = [token, {}]
+            return
+
+        node = self.root
+        while True:
+            distance = myers_distance(node[0], token)
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [token, {}]
+                return
+            node = child
+
+    def update(self, tokens):
+        """Add every token not yet in the tree, returns the number added"""
+        before = len(self.tokens)
+        for token in tokens:
+            self.add(token)
+        return len(self.tokens) - before
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def search(self, word: str, radius: int) -> list[tuple[str, int]]:
+        """All (token, distance) pairs with edit distance to word at most radius"""
+        if self.root is None or radius < 0:
+            return []
+        peq = myers_peq(word)
+        found = []
+        stack = [self.root]
+        while stack:
+            token, children = stack.pop()
+            distance = myers_distance(word, token, peq)
+            if distance <= radius:
+                found.append((token, distance))
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return found
+
+    def fuzzy_search(self, keyword: str, threshold: float = 80.0) -> list[str]:
+        """
+        Tokens whose match percentage with keyword reaches threshold (same decision as
+        levenshtein_distance). The search radius is the largest distance any token length allows.
+        """
+        keyword = keyword.lower()
+        k = len(keyword)
+        if k == 0:
+            return []
+        if threshold <= 0:
+            return list(self.tokens)
+
+        # Longer tokens allow larger distances; stop once the length difference alone exceeds the bound
+        radius = max_edit_distance(k, k, threshold)
+        length = k + 1
+        while length - k <= max_edit_distance(k, length, threshold):
+            radius = max(radius, max_edit_distance(k, length, threshold))
+            length += 1
+
+        return [
+            token for token, distance in self.search(keyword, radius)
+            if distance <= max_edit_distance(k, len(token), threshold)
+        ]
+
+    def save(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: Path):
+        """Load a persisted tree, or None if missing or unreadable"""
+        try:
+            with open(path, 'rb') as f:
+                tree = pickle.load(f)
+            return tree if isinstance(tree, BKTree) else None
+        except (FileNotFoundError, pickle.PickleError, EOFError, AttributeError):
+            return None
@@ -0,0 +1,142 @@
+from concurrent.futures import ProcessPoolExecutor, wait, as_completed, FIRST_COMPLETED
+import os
+from core.algorithm import search_texts, fuzzy_match
+from core.corpus import SharedCorpus
+from core.utils import extract_cv_entry
+from core.regex import process_cv
+
+# --- parallel search over CV shards ---
+
+FUZZY = "Fuzzy"
+# How often a search waiting on its shards checks whether it should stop
+STOP_POLL_SECONDS = 0.05
+
+# Worker-side view of the shared corpus, attached once per worker process by the initializer
+_corpus = None
+
+def _init_worker(segment_name: str):
+    # The mapping is released when the worker exits; only the owning process unlinks the segment
+    global _corpus
+    _corpus = SharedCorpus.attach(segment_name)
+
+def _warm_up() -> int:
+    return os.getpid()
+
+def _search_shard(doc_ids: list, keywords: list[str], algo: str) -> list:
+    """Run algo over the documents of one shard, returns [(doc_id, keywords_data)] for matches"""
+    texts = ((doc_id, _corpus.text(doc_id)) for doc_id in doc_ids if doc_id in _corpus)
+    if algo == FUZZY:
+        results = ((doc_id, fuzzy_match(text, keywords)) for doc_id, text in texts)
+    else:
+        results = search_texts(texts, keywords, algo)
+    return [(doc_id, keywords_data) for doc_id, keywords_data in results if keywords_data]
+
+
+class SearchPool:
+    """
+    Process pool with persistent warm workers for searching the corpus in parallel.
+    Workers attach to the SharedCorpus segment once, when they start, and read texts from
+    the shared pages; a query only sends the shard's doc ids and the keywords. Shard results
+    are merged in corpus order, so the output does not depend on which worker finishes first.
+    """
+    def __init__(self, corpus: SharedCorpus, workers: int = 0, shards_per_worker: int = 4):
+        self.workers = workers or os.cpu_count() or 1
+        doc_ids = corpus.doc_ids
+        shard_count = max(1, min(len(doc_ids), self.workers * shards_per_worker))
+        shard_size = -(-len(doc_ids) // shard_count) if doc_ids else 1
+        self.shards = [doc_ids[i:i + shard_size] for i in range(0, len(doc_ids), shard_size)]
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(corpus.name,),
+        )
+        # Start every worker now so the first query does not pay for process start-up
+        for future in [self.executor.submit(_warm_up) for _ in range(self.workers)]:
+            future.result()
+
+    def search(self, keywords: list[str], algo: str, should_stop=None) -> dict:
+        """
+        Run algo (an exact algorithm name or FUZZY) over every shard: {doc_id: keywords_data}.
+        should_stop() is polled while waiting for the shards; once it returns True (or raises)
+        the shards not started yet are cancelled and the ones merged so far are returned.
+        """
+        futures = [self.executor.submit(_search_shard, shard, keywords, algo) for shard in self.shards]
+        merged = {}
+        try:
+            for future in futures:
+                while should_stop is not None and not future.done():
+                    if should_stop():
+                        return merged
+                    wait([future], timeout=STOP_POLL_SECONDS)
+                for doc_id, keywords_data in future.result():
+                    merged[doc_id] = keywords_data
+        finally:
+            for future in futures:
+                future.cancel()
+        return merged
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+# --- parallel PDF extraction ---
+
+def _extract_chunk(cv_paths: list) -> list:
+    """Extract one chunk of CVs, returns [(cv_path, entry, error)] with exactly one of entry/error set"""
+    results = []
+    for cv_path in cv_paths:
+        try:
+            entry = extract_cv_entry(cv_path)
+        except Exception as e:
+            results.append((cv_path, None, str(e) or type(e).__name__))
+        else:
+            results.append((cv_path, entry, None))
+    return results
+
+def iter_extract_cvs(cv_paths: list, workers: int = 0, chunk_size: int = 4, max_in_flight: int = 0):
+    """
+    Extract many CVs on a process pool, yielding (cv_path, entry, error) as each chunk completes.
+    Paths are submitted in chunks and at most max_in_flight chunks (default 2 per worker)
+    are pending at any time, so a large backlog never sits in the executor queue.
+    A file that fails is yielded with its error and the rest of the run continues.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    chunks = [cv_paths[i:i + chunk_size] for i in range(0, len(cv_paths), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        # Not worth starting processes for a single chunk
+        for chunk in chunks:
+            yield from _extract_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        pending = set()
+        for chunk in chunks:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            pending.add(executor.submit(_extract_chunk, chunk))
+        for future in as_completed(pending):
+            yield from future.result()
+
+
+# --- parallel CV parsing ---
+
+def _parse_chunk(documents: list) -> list:
+    return [(detail_id, process_cv(cv_text)) for detail_id, cv_text in documents]
+
+def parse_cvs(documents: dict, workers: int = 0, chunk_size: int = 16) -> dict:
+    """Run process_cv over {detail_id: text} on a process pool: {detail_id: parse}"""
+    workers = workers or os.cpu_count() or 1
+    items = list(documents.items())
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return dict(_parse_chunk(items))
+
+    parses = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for results in executor.map(_parse_chunk, chunks):
+            parses.update(results)
+    return parses
@@ -0,0 +1,37 @@
+from heapq import heappush, heapreplace
+
+# --- relevance ranking of matched CVs ---
+
+def score(keywords_data: list[dict], rank: int) -> tuple:
+    """
+    Relevance of a CV: distinct matched keywords first, then total occurrences.
+    rank is the CV's position in database order and breaks ties in favour of earlier CVs.
+    """
+    return (len(keywords_data), sum(data["occurrences"] for data in keywords_data), -rank)
+
+
+class TopK:
+    """Bounded min-heap keeping the k best-scored items; k <= 0 keeps every item"""
+    def __init__(self, k: int):
+        self.k = k
+        self.heap = []  # (score, item); scores are unique because they include the rank
+
+    def full(self) -> bool:
+        return self.k > 0 and len(self.heap) >= self.k
+
+    def admits(self, key: tuple) -> bool:
+        """Whether an item scored key (or any upper bound on its score) could still enter"""
+        return not self.full() or key > self.heap[0][0]
+
+    def push(self, key: tuple, item):
+        if not self.full():
+            heappush(self.heap, (key, item))
+        elif key > self.heap[0][0]:
+            heapreplace(self.heap, (key, item))
+
+    def __len__(self):
+        return len(self.heap)
+
+    def items(self) -> list:
+        """Items from best to worst"""
+        return [item for _, item in sorted(self.heap, key=lambda entry: entry[0], reverse=True)]
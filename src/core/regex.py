@@ -1,15 +1,28 @@
 import fitz  # PyMuPDF
 import re
 
+# Version of the parse produced by process_cv; bump it whenever the parsing changes,
+# stored parses from another version are recomputed
+PARSER_VERSION = 1
+
+# Patterns used by the entry parsers, compiled once
+SKILLS_HEADING_PATTERN = re.compile(r'(?i)skills|highlights')
+SKILLS_SEPARATOR_PATTERN = re.compile(r'[\n•*-]')
+EDUCATION_ENTRY_PATTERN = re.compile(r'(?i)(bachelor|master|associate|phd|diploma|b\.s|m\.s|b\.a)')
+YEAR_PATTERN = re.compile(r'(\d{4})')
+EXPERIENCE_SPLITTER_PATTERN = re.compile(r'\n(?=[A-Z][a-z\s]+.*\n(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})')
+EXPERIENCE_YEAR_PATTERN = re.compile(r'(?i)((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s\d{4}\s*to\s*(?:Current|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s\d{4}))')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 def parse_skills(skills_block):
     """Mem-parsing blok teks skills menjadi sebuah list yang lebih bersih."""
     if not skills_block:
         return []
     
     # Hapus judul bagian seperti 'Skills' atau 'Highlights' dari blok itu sendiri
-    skills_block = re.sub(r'(?i)skills|highlights', '', skills_block)
+    skills_block = SKILLS_HEADING_PATTERN.sub('', skills_block)
     # Ganti baris baru dan bullet dengan koma
-    cleaned_text = re.sub(r'[\n•*-]', ',', skills_block)
+    cleaned_text = SKILLS_SEPARATOR_PATTERN.sub(',', skills_block)
     
     # Pisahkan, bersihkan, dan hapus item yang tidak relevan/kosong
     skills_list = [skill.strip() for skill in cleaned_text.split(',') if len(skill.strip()) > 1]
@@ -21,15 +34,14 @@ def parse_education(education_block):
         return []
         
     education_list = []
-    # Pola untuk mengenali baris yang memulai entri pendidikan
-    entry_pattern = r'(?i)(bachelor|master|associate|phd|diploma|b\.s|m\.s|b\.a)'
     
     current_entry_lines = []
     for line in education_block.strip().split('\n'):
-        if re.search(entry_pattern, line) and current_entry_lines:
+        # EDUCATION_ENTRY_PATTERN mengenali baris yang memulai entri pendidikan
+        if EDUCATION_ENTRY_PATTERN.search(line) and current_entry_lines:
             entry_text = ' '.join(current_entry_lines)
             edu_dict = {}
-            year_match = re.search(r'(\d{4})', entry_text)
+            year_match = YEAR_PATTERN.search(entry_text)
             if year_match:
                 edu_dict['year'] = year_match.group(1)
             
@@ -48,7 +60,7 @@ def parse_education(education_block):
     if current_entry_lines:
         entry_text = ' '.join(current_entry_lines)
         edu_dict = {}
-        year_match = re.search(r'(\d{4})', entry_text)
+        year_match = YEAR_PATTERN.search(entry_text)
         if year_match:
             edu_dict['year'] = year_match.group(1)
         
@@ -65,11 +77,9 @@ def parse_experience(experience_block):
     if not experience_block:
         return []
 
-    splitter_pattern = r'\n(?=[A-Z][a-z\s]+.*\n(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})'
-    entries = re.split(splitter_pattern, experience_block.strip())
+    entries = EXPERIENCE_SPLITTER_PATTERN.split(experience_block.strip())
     
     job_list = []
-    year_pattern = r'(?i)((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s\d{4}\s*to\s*(?:Current|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s\d{4}))'
 
     for entry in entries:
         if not entry.strip() or len(entry.strip()) < 20: # Abaikan entri yang terlalu pendek
@@ -80,7 +90,7 @@ def parse_experience(experience_block):
         
         job_dict['position'] = lines[0]
         
-        year_match = re.search(year_pattern, entry)
+        year_match = EXPERIENCE_YEAR_PATTERN.search(entry)
         job_dict['year'] = year_match.group(0) if year_match else ''
         
         # Gabungkan semua baris menjadi satu untuk deskripsi
@@ -88,28 +98,76 @@ def parse_experience(experience_block):
         # Hapus info tahun dari deskripsi
         if job_dict['year']:
             full_desc_text = full_desc_text.replace(job_dict['year'], '')
-        job_dict['description'] = re.sub(r'\s+', ' ', full_desc_text).strip()
+        job_dict['description'] = WHITESPACE_PATTERN.sub(' ', full_desc_text).strip()
         
         job_list.append(job_dict)
 
     return job_list
 
-def process_cv(full_text):
+# --- Section segmenter ---
 
-    # Pola Regex untuk Ekstraksi Blok (termasuk 'Highlights' untuk skills)
-    pattern_experience = r"(?i)(?:Experience|Professional Experience|Work Experience)\b([\s\S]*?)(?=\n(?:Education|Skills|Highlights|Projects|Qualifications|Accomplishments|Awards)\b|\Z)"
-    pattern_education = r"(?i)(?:Education|Education and Training)\b([\s\S]*?)(?=\n(?:Experience|Skills|Highlights|Projects|Qualifications|Accomplishments|Awards)\b|\Z)"
-    pattern_skills = r"(?i)(?:Skills|Highlights)\b([\s\S]*?)(?=\n(?:Experience|Education|Projects|Qualifications|Accomplishments|Awards)\b|\Z)"
+# Every heading word the segmenter looks for, as a named group so a match tells which one it found.
+# A section starts after the first occurrence of one of its heading words, anywhere in the text,
+# and ends at the first line starting with a heading word that closes it, or at the end of the text.
+# The lookahead on first letters lets the engine skip positions that cannot start a heading.
+HEADING_WORDS = ("experience", "education", "skills", "highlights", "projects", "qualifications", "accomplishments", "awards")
+HEADING_ALTERNATION = "(?:" + "|".join(f"(?P<{word}>{word})" for word in HEADING_WORDS) + r")\b"
+HEADING_PATTERN = re.compile(
+    r"(?=[" + "".join(sorted({word[0] for word in HEADING_WORDS})) + r"])" + HEADING_ALTERNATION,
+    re.IGNORECASE,
+)
+# Once every section has started only headings at the start of a line matter
+LINE_HEADING_PATTERN = re.compile(r"\n" + HEADING_ALTERNATION, re.IGNORECASE)
+SECTIONS = {
+    # section: (words opening it, line-start words closing it)
+    "experience": ({"experience"}, {"education", "skills", "highlights", "projects", "qualifications", "accomplishments", "awards"}),
+    "education": ({"education"}, {"experience", "skills", "highlights", "projects", "qualifications", "accomplishments", "awards"}),
+    "skills": ({"skills", "highlights"}, {"experience", "education", "projects", "qualifications", "accomplishments", "awards"}),
+}
+
+def segment_sections(full_text):
+    """
+    Find the experience, education and skills blocks in a single forward scan of the text.
+    Returns {section: block text or None}, the same blocks the per-section searches
+    (heading)\b([\s\S]*?)(?=\n(closing headings)\b|\Z) capture.
+    """
+    starts = {}  # open sections: offset right after their heading
+    blocks = dict.fromkeys(SECTIONS)
+    pattern = HEADING_PATTERN
+    position = 0
+    while True:
+        match = pattern.search(full_text, position)
+        if match is None:
+            break
+        position = match.end()
+        word = match.lastgroup
+        line_start = match.start(word) - 1
+        if line_start >= 0 and full_text[line_start] == "\n":
+            # Heading at the start of a line: closes the open sections it terminates
+            for section, start in list(starts.items()):
+                if word in SECTIONS[section][1]:
+                    blocks[section] = full_text[start:line_start]
+                    del starts[section]
+        for section, (openers, _) in SECTIONS.items():
+            if word in openers and section not in starts and blocks[section] is None:
+                starts[section] = position
+        if not starts and None not in blocks.values():
+            break
+        if all(section in starts or blocks[section] is not None for section in SECTIONS):
+            pattern = LINE_HEADING_PATTERN
+    for section, start in starts.items():
+        blocks[section] = full_text[start:]
+    return blocks
+
+def process_cv(full_text):
 
-    # Ekstrak setiap blok
-    experience_block_match = re.search(pattern_experience, full_text)
-    education_block_match = re.search(pattern_education, full_text)
-    skills_block_match = re.search(pattern_skills, full_text)
+    # Ekstrak setiap blok dalam satu kali pemindaian
+    blocks = segment_sections(full_text)
 
     # Parsing setiap blok
-    skills = parse_skills(skills_block_match.group(1) if skills_block_match else None)
-    education = parse_education(education_block_match.group(1) if education_block_match else None)
-    job_history = parse_experience(experience_block_match.group(1) if experience_block_match else None)
+    skills = parse_skills(blocks["skills"])
+    education = parse_education(blocks["education"])
+    job_history = parse_experience(blocks["experience"])
 
     cv_data = {
         "skills": skills,
@@ -117,4 +175,4 @@ def process_cv(full_text):
         "job_history": job_history
     }
     
-    return cv_data
\ No newline at end of file
+    return cv_data
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from models.model import ApplicantProfile, ApplicationDetail
 
 # --- AplicantProfile Repository Functions ---
@@ -15,6 +15,12 @@ def repo_get_applicant_by_id(db: Session, applicant_id: int):
     """
     return db.query(ApplicantProfile).filter(ApplicantProfile.applicant_id == applicant_id).first()
 
+def repo_get_applicants_with_applications(db: Session):
+    """
+    Retrieve all applicants with their applications loaded in a single joined query.
+    """
+    return db.query(ApplicantProfile).options(joinedload(ApplicantProfile.applications)).all()
+
 def repo_insert_applicant(db: Session, applicant: ApplicantProfile):
     """
     Insert a new applicant into the database.
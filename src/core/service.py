@@ -1,75 +1,497 @@
 from core.database import get_db
 from core.repository import *
 from datetime import date
-from core.algorithm import knuth_morris_pratt, boyer_moore, aho_corasick, fuzzy_match
-from core.utils import extract_text_from_pdf
+from core.algorithm import ALGORITHMS, compile_patterns
+from core.index import Vocabulary, BKTree, InvertedIndex
+from core.corpus import Corpus, SharedCorpus
+from core.store import TextStore
+from core.parallel import SearchPool, iter_extract_cvs, parse_cvs
+from core.ranking import TopK, score
+from core.utils import file_sha1
 import time
 import pickle
 import json
 import os
+import atexit
+import copy
+import threading
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, defaultdict
 from pathlib import Path
-from core.regex import process_cv
-
-cv_data_text = {}
+from core.regex import process_cv, PARSER_VERSION
+
+text_store = TextStore()  # lowercase CV texts by detail_id, memory-mapped from TEXT_STORE_FILE
+loaded_texts = {}  # texts extracted during the warm-up, until they are written to text_store
+vocabulary = Vocabulary()
+inverted_index = InvertedIndex()
+corpus = None  # single-buffer corpus, built once every CV is indexed
+indexed_ids = set()  # detail_ids of the CVs searchable so far
+index_lock = threading.Lock()  # held by searches and by every change to the indexes
 CACHE_FILE = Path("data/cache/cv_data_cache.pkl")
+TEXT_STORE_FILE = Path("data/cache/cv_texts.bin")
+PARSE_CACHE_FILE = Path("data/cache/cv_parses.pkl")
+FUZZY_INDEX_FILE = Path("data/cache/fuzzy_index.pkl")
+
+# Number of worker processes for parallel search, 0 searches in this process only
+SEARCH_WORKERS = int(os.getenv("SEARCH_WORKERS", "0"))
+search_pool = None
+shared_corpus = None  # shared memory copy of the corpus the workers attach to
+
+# Number of worker processes for PDF extraction, 0 uses every core
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "0"))
+extraction_errors = {}  # {cv_path: error message} of the last extraction run
+
+# Per-file extraction metadata: {cv_path: {"size", "mtime", "sha1", "detail_ids"}}, detail_ids
+# being every application sharing the file; the texts live in the memory-mapped TEXT_STORE_FILE
+CACHE_VERSION = 4
+file_cache = {}
 
 def save_cache():
-    """Save cv_data_text to cache file"""
+    """Save the per-file extraction metadata"""
     CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(CACHE_FILE, 'wb') as f:
-        pickle.dump(cv_data_text, f)
+        pickle.dump({"version": CACHE_VERSION, "files": file_cache}, f)
 
 def load_cache():
-    """Load cv_data_text from cache file"""
-    global cv_data_text
+    """Load the per-file extraction metadata, returns False if there is no usable cache"""
+    global file_cache
     try:
         if CACHE_FILE.exists():
             with open(CACHE_FILE, 'rb') as f:
-                cv_data_text = pickle.load(f)
+                data = pickle.load(f)
+            if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                file_cache = data["files"]
                 return True
     except (FileNotFoundError, pickle.PickleError, EOFError):
-        cv_data_text = {}
+        pass
+    file_cache = {}
+    return False
+
+# Skills, education and job history of every CV, parsed once by process_cv: {detail_id: parse}
+cv_parses = {}
+
+def save_parses():
+    """Save cv_parses, tagged with the parser version that produced them"""
+    PARSE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(PARSE_CACHE_FILE, 'wb') as f:
+        pickle.dump({"parser_version": PARSER_VERSION, "parses": cv_parses}, f)
+
+def load_parses() -> dict:
+    """Stored parses, empty when there are none or they come from another parser version"""
+    try:
+        if PARSE_CACHE_FILE.exists():
+            with open(PARSE_CACHE_FILE, 'rb') as f:
+                data = pickle.load(f)
+            if isinstance(data, dict) and data.get("parser_version") == PARSER_VERSION:
+                return data["parses"]
+    except (FileNotFoundError, pickle.PickleError, EOFError):
+        pass
+    return {}
+
+def is_file_unchanged(cv_path: str) -> bool:
+    """
+    True if the CV file matches its cache entry: same size and mtime, or, when only the
+    mtime moved, the same content hash.
+    """
+    entry = file_cache.get(cv_path)
+    if entry is None:
+        return False
+    try:
+        stat = os.stat(cv_path)
+    except OSError:
+        return False
+    if entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+        return True
+    if entry["size"] == stat.st_size and entry["sha1"] == file_sha1(cv_path):
+        entry["mtime"] = stat.st_mtime
+        return True
     return False
 
-def extract_all_cv_data(force_refresh=False):
+def extract_all_cv_data(force_refresh=False, progress=None):
     """
-    Extract all CV data with caching support
+    Load, extract and index every CV with a per-file cache: only new or changed PDFs are
+    extracted, in parallel on EXTRACT_WORKERS processes, and CVs whose application no longer
+    exists are dropped. The texts are kept in the memory-mapped text store, which is only
+    rewritten when something changed. Each CV is parsed by process_cv once, when it is
+    extracted or when the stored parses come from another PARSER_VERSION.
+    CVs become searchable one by one: first those already in the text store, then each PDF
+    as soon as it is extracted, so a search issued meanwhile covers the CVs loaded so far.
+    Progress is published on warm_up; progress(done, total, cv_path, error) is also called
+    after every extracted file. Files that fail are skipped and kept in extraction_errors.
     """
-    global cv_data_text
+    global text_store, file_cache, extraction_errors, cv_parses
+    
+    warm_up.update(state="loading", done=0, total=0, error=None)
+    if force_refresh:
+        file_cache = {}
+    else:
+        load_cache()
+    stored = (not force_refresh and TextStore.open(TEXT_STORE_FILE)) or TextStore()
     
-    # Try to load from cache first (unless force refresh)
-    if not force_refresh and load_cache():
-        print(f"Loaded {len(cv_data_text)} CV records from cache")
-        return cv_data_text
+    applications = [
+        application for application in get_all_applications()
+        if application.cv_path and application.applicant_id # type: ignore
+    ]
+    stale = [
+        application for application in applications
+        if not (
+            application.detail_id in stored
+            and application.detail_id in file_cache.get(application.cv_path, {}).get("detail_ids", ())
+            and is_file_unchanged(application.cv_path)
+        )
+    ]
+    stale_ids = {application.detail_id for application in stale}
+    stale_by_path = defaultdict(list)
+    for application in stale:
+        stale_by_path[application.cv_path].append(application.detail_id)
     
-    print("Extracting CV data from PDFs...")
-    from core.service import get_all_applications
+    with index_lock:
+        reset_indexes()
+        text_store.close()
+        text_store = stored
+        cv_parses = {} if force_refresh else load_parses()
     
-    cv_data_text = {}  # Reset the dictionary
-    applications = get_all_applications()
-
+    # CVs whose cached text is still valid are searchable straight away. Every text is decoded
+    # once here and kept in documents for the store records, the parses and the corpus buffer
+    warm_up.update(state="indexing", total=len(applications))
+    documents = {}
+    fresh_ids = [application.detail_id for application in applications if application.detail_id not in stale_ids]
+    for i in range(0, len(fresh_ids), INDEX_BATCH_SIZE):
+        batch = fresh_ids[i:i + INDEX_BATCH_SIZE]
+        with index_lock:
+            for detail_id in batch:
+                documents[detail_id] = text_store.text(detail_id)
+                index_document(detail_id, documents[detail_id])
+        warm_up.update(done=warm_up.done + len(batch))
+    
+    warm_up.update(state="extracting")
+    entries, extraction_errors = {}, {}
+    stale_paths = sorted(stale_by_path)
+    for cv_path, entry, error in iter_extract_cvs(stale_paths, workers=EXTRACT_WORKERS):
+        if error is None:
+            entries[cv_path] = entry
+            with index_lock:
+                for detail_id in stale_by_path[cv_path]:
+                    documents[detail_id] = entry["cv_text"]
+                    loaded_texts[detail_id] = entry["cv_text"]
+                    cv_parses[detail_id] = entry["parsed"]
+                    index_document(detail_id, entry["cv_text"])
+        else:
+            extraction_errors[cv_path] = error
+        warm_up.update(done=warm_up.done + len(stale_by_path[cv_path]))
+        if progress:
+            progress(len(entries) + len(extraction_errors), len(stale_paths), cv_path, error)
+    
+    warm_up.update(state="finishing")
+    records = []
+    ids_by_path = defaultdict(set)
     for application in applications:
-        if application.cv_path and application.applicant_id: # type: ignore
-            cv_text = extract_text_from_pdf(application.cv_path)
-            cv_text = cv_text.lower()
-            if cv_text:
-                cv_data_text[application.detail_id] = {
-                    "applicant_id": application.applicant_id,
-                    "cv_text": cv_text,
-                    "cleaned_text": cv_text.replace('\n', ' ').strip()
-                }
+        if application.detail_id in stale_ids:
+            entry = entries.get(application.cv_path)
+            if entry is None:
+                file_cache.pop(application.cv_path, None)
+                continue
+            cv_text = entry["cv_text"]
+            file_cache[application.cv_path] = {
+                "size": entry["size"],
+                "mtime": entry["mtime"],
+                "sha1": entry["sha1"],
+            }
+        else:
+            cv_text = documents[application.detail_id]
+        records.append((application.detail_id, application.applicant_id, cv_text))
+        ids_by_path[application.cv_path].add(application.detail_id)
+    # Several applications can share one PDF; each of them stays valid on the next start
+    for cv_path, detail_ids in ids_by_path.items():
+        if cv_path in file_cache:
+            file_cache[cv_path]["detail_ids"] = detail_ids
+    
+    # Drop CVs that no longer belong to an application
+    current_paths = {application.cv_path for application in applications}
+    removed = [cv_path for cv_path in file_cache if cv_path not in current_paths]
+    for cv_path in removed:
+        del file_cache[cv_path]
     
-    # Save to cache
-    save_cache()
-    print(f"Extracted and cached {len(cv_data_text)} CV records")
-    return cv_data_text
+    unchanged = not entries and [
+        (detail_id, applicant_id) for detail_id, applicant_id, _ in sorted(records, key=lambda record: record[0])
+    ] == list(zip(text_store.detail_ids, text_store.applicant_ids))
+    if not unchanged:
+        with index_lock:
+            # The old mapping has to be released before the file is replaced
+            text_store.close()
+            TextStore.write(TEXT_STORE_FILE, records)
+            text_store = TextStore.open(TEXT_STORE_FILE)
+            loaded_texts.clear()
+        save_cache()
+    elif removed:
+        save_cache()
+    
+    # Parse the CVs that have no stored parse, drop the parses of removed CVs
+    record_ids = {detail_id for detail_id, _, _ in records}
+    unparsed = {detail_id: cv_text for detail_id, _, cv_text in records if detail_id not in cv_parses}
+    parses = parse_cvs(unparsed, workers=EXTRACT_WORKERS) if unparsed else {}
+    dropped = [detail_id for detail_id in cv_parses if detail_id not in record_ids]
+    with index_lock:
+        cv_parses.update(parses)
+        for detail_id in dropped:
+            del cv_parses[detail_id]
+    if entries or parses or dropped:
+        save_parses()
+    finish_indexes(documents)
+    del documents
+    
+    warm_up.update(state="ready")
+    print(f"Loaded {len(text_store)} CV records ({len(entries)} extracted, {len(removed)} removed from cache)")
+    for cv_path, error in extraction_errors.items():
+        print(f"Could not extract {cv_path}: {error}")
+    return text_store
+
+# CVs indexed per hold of index_lock while the warm-up loads the text store
+INDEX_BATCH_SIZE = 64
+
+def document_text(detail_id) -> str:
+    """Lowercase text of one CV, newlines kept; empty if it is not loaded"""
+    cv_text = loaded_texts.get(detail_id)
+    return cv_text if cv_text is not None else text_store.text(detail_id)
+
+def reset_indexes():
+    """Empty every index; the caller holds index_lock"""
+    global vocabulary, inverted_index, corpus
+    shutdown_search_pool()
+    vocabulary = Vocabulary()
+    inverted_index = InvertedIndex()
+    corpus = None
+    indexed_ids.clear()
+    loaded_texts.clear()
+    bump_corpus_version()
+
+def index_document(detail_id, cv_text: str):
+    """Make one CV searchable; the caller holds index_lock"""
+    # Texts keep their newlines: process_cv needs them and the matchers read them as spaces
+    if not cv_text or cv_text.isspace():
+        return
+    vocabulary.add_document(detail_id, cv_text)
+    inverted_index.add_document(detail_id, cv_text)
+    indexed_ids.add(detail_id)
+
+def finish_indexes(documents: dict):
+    """
+    Build what needs the whole corpus from the texts the warm-up decoded ({detail_id: cv_text}):
+    the single-buffer corpus, the BK-tree and the worker pool
+    """
+    global corpus
+    documents = {detail_id: cv_text for detail_id, cv_text in documents.items() if detail_id in indexed_ids}
+    full_corpus = Corpus(documents)
+
+    # The BK-tree is persisted and only grows: tokens from new CVs are inserted,
+    # tokens of removed CVs stay in the tree but have no postings
+    bktree = BKTree.load(FUZZY_INDEX_FILE) or BKTree()
+    if bktree.update(vocabulary.postings):
+        bktree.save(FUZZY_INDEX_FILE)
+
+    if SEARCH_WORKERS > 0:
+        start_search_pool(documents, SEARCH_WORKERS)
+    with index_lock:
+        corpus = full_corpus
+        vocabulary.bktree = bktree
+        bump_corpus_version()
+
+def start_search_pool(documents: dict, workers: int = 0):
+    """(Re)start the worker pool for parallel search over documents, placed in shared memory"""
+    global search_pool, shared_corpus
+    shutdown_search_pool()
+    shared_corpus = SharedCorpus.create(documents)
+    search_pool = SearchPool(shared_corpus, workers)
+
+@atexit.register
+def shutdown_search_pool():
+    """Stop the worker pool, if running, and unlink its shared memory segment"""
+    global search_pool, shared_corpus
+    if search_pool is not None:
+        search_pool.shutdown()
+        search_pool = None
+    if shared_corpus is not None:
+        shared_corpus.close()
+        shared_corpus = None
 
 def clear_cache():
-    """Clear the cache file"""
+    """Clear the cache files"""
+    if FUZZY_INDEX_FILE.exists():
+        FUZZY_INDEX_FILE.unlink()
+    if TEXT_STORE_FILE.exists():
+        TEXT_STORE_FILE.unlink()
+    if PARSE_CACHE_FILE.exists():
+        PARSE_CACHE_FILE.unlink()
     if CACHE_FILE.exists():
         CACHE_FILE.unlink()
         print("Cache cleared")
 
+# --- Background warm-up ---
+
+class WarmUp:
+    """
+    Progress of the corpus warm-up, readable from any thread. state is "idle", "loading",
+    "indexing", "extracting", "finishing", "ready" or "failed"; done counts the CVs processed
+    out of total. Listeners are called with snapshot() after every update, from the warm-up thread.
+    """
+    def __init__(self):
+        self.state = "idle"
+        self.done = 0
+        self.total = 0
+        self.error = None
+        self.thread = None
+        self.listeners = []
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "ready": self.ready,
+            "done": self.done,
+            "total": self.total,
+            "searchable": len(indexed_ids),
+            "error": self.error,
+        }
+
+    def update(self, **changes):
+        for name, value in changes.items():
+            setattr(self, name, value)
+        for listener in list(self.listeners):
+            listener(self.snapshot())
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+warm_up = WarmUp()
+
+def start_warm_up(force_refresh=False, progress=None) -> threading.Thread:
+    """
+    Run extract_all_cv_data in a background thread so the UI is usable straight away;
+    searches meanwhile cover the CVs loaded so far. Does nothing if a warm-up is running.
+    """
+    if warm_up.running:
+        return warm_up.thread
+
+    def run():
+        try:
+            extract_all_cv_data(force_refresh, progress)
+        except Exception as e:
+            warm_up.update(state="failed", error=str(e))
+            print(f"Warm-up failed: {e}")
+
+    warm_up.thread = threading.Thread(target=run, name="corpus-warm-up", daemon=True)
+    warm_up.thread.start()
+    return warm_up.thread
+
+# --- Query result cache ---
+
+corpus_version = 0  # bumped whenever the searchable data changes, so cached results go stale
+
+def bump_corpus_version():
+    global corpus_version
+    corpus_version += 1
+
+class QueryCache:
+    """
+    LRU cache of finished search results with a time-to-live, keyed by
+    (normalized keywords, algorithm, top_match, corpus version).
+    """
+    def __init__(self, max_size: int = 128, ttl_seconds: float = 600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (stored at, results_data)
+
+    @staticmethod
+    def normalize_keywords(keywords: list[str]) -> list[str]:
+        """
+        Keywords stripped, without blanks or repeats. Case and order are kept: KMP/Boyer-Moore
+        are case sensitive and results follow keyword order
+        """
+        return list(dict.fromkeys(k.strip() for k in keywords if k.strip()))
+
+    @staticmethod
+    def make_key(keywords: list[str], algo: str, top_match: int) -> tuple:
+        # keywords as searched, i.e. already normalized
+        return (tuple(keywords), algo, top_match, corpus_version)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and time.time() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            self.evictions += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def put(self, key, results_data: dict):
+        self._entries[key] = (time.time(), copy.deepcopy(results_data))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+query_cache = QueryCache()
+
+# --- In-memory applicant roster ---
+
+roster = None  # [(applicant, [applications])] in database order, loaded on first use
+
+def get_roster():
+    """
+    Return every applicant with their applications, loaded with one joined query and kept
+    in memory, so a search does not touch the database.
+    """
+    global roster
+    if roster is None:
+        db = next(get_db())
+        try:
+            roster = [
+                (applicant, list(applicant.applications))
+                for applicant in repo_get_applicants_with_applications(db)
+            ]
+        finally:
+            db.close()
+    return roster
+
+def invalidate_roster():
+    """Drop the roster so the next search reloads it"""
+    global roster
+    roster = None
+
 # --- Service Functions for ApplicantProfile ---
 
 def get_all_applicants():
@@ -105,7 +527,9 @@ def insert_applicant(first_name: str, last_name: str, date_of_birth: date, addre
             address=address,
             phone_number=phone_number
         )
-        return repo_insert_applicant(db, applicant)
+        applicant = repo_insert_applicant(db, applicant)
+        invalidate_roster()
+        return applicant
     finally:
         db.close()
 
@@ -148,7 +572,10 @@ def insert_application(applicant_id: int, application_role: str, cv_path: str):
             application_role=application_role,
             cv_path=cv_path
         )
-        return repo_insert_application(db, application)
+        application = repo_insert_application(db, application)
+        invalidate_roster()
+        bump_corpus_version()
+        return application
     finally:
         db.close()
 
@@ -168,7 +595,13 @@ def get_cv_data_by_detail_id(detail_id: int):
         if not applicant:
             return None
         
-        regex_res = process_cv(cv_data_text.get(application.detail_id, {}).get("cv_text", ""))
+        # Parsed at extraction time; parse on the spot only while the warm-up has not reached this CV
+        regex_res = cv_parses.get(application.detail_id)
+        if regex_res is None:
+            # The warm-up may be closing and rewriting the text store meanwhile
+            with index_lock:
+                cv_text = document_text(application.detail_id)
+            regex_res = process_cv(cv_text)
 
         cv_data = {
             "name": f"{applicant.first_name} {applicant.last_name}",
@@ -186,104 +619,231 @@ def get_cv_data_by_detail_id(detail_id: int):
         db.close()
 
 
-def search_matching_data(keywords: list[str], algo: str, top_match: int) -> dict:
-    applicants = get_all_applicants()
+def make_result(applicant, application, keywords_data: list[dict]) -> dict:
+    """Format one matched CV for the results panel"""
+    return {
+        "applicant_id": applicant.applicant_id,
+        "detail_id": application.detail_id,
+        "name": f"{applicant.first_name} {applicant.last_name}",
+        "matched_keywords": len(keywords_data),
+        "keywords_data": keywords_data,
+        "cv_path": application.cv_path,
+        "bgcolor": "#E3F2FD"  # Example background color
+    }
 
-    applicant_match_count = 0
-    applicants_results = []
-    chosen_applications = set()
+def get_candidates() -> list:
+    """(rank, applicant, application) for every application whose CV is searchable, in database order"""
+    candidates = []
+    for applicant, applications in get_roster():
+        for application in applications:
+            if application.detail_id in indexed_ids:
+                candidates.append((len(candidates), applicant, application))
+    return candidates
 
-    curr_time = time.time()
+def rank_exact_matches(candidates: list, keywords: list[str], algo: str, top_match: int, control=None) -> TopK:
+    """
+    Exact phase: keep the top_match best CVs. When every CV has to be scanned one by one,
+    CVs are visited by decreasing upper bound (from the vocabulary postings) and the scan
+    stops once no remaining CV can enter the heap, or when control says to stop.
+    """
+    top = TopK(top_match)
+    should_stop = control.should_stop if control is not None else None
+
+    if algo == "Inverted-Index":
+        # Whole-word matches straight from the postings, no text is rescanned
+        corpus_results = inverted_index.search(keywords, should_stop=should_stop)
+    elif search_pool is not None:
+        # Shards of the corpus are scanned by the worker processes
+        corpus_results = search_pool.search(keywords, algo, should_stop=should_stop)
+    elif algo == "Aho-Corasick" and corpus is not None:
+        # Automaton passes over blocks of the corpus buffer instead of one call per CV
+        corpus_results = corpus.aho_corasick(keywords, should_stop=should_stop)
+    else:
+        corpus_results = None
+
+    if corpus_results is not None:
+        for rank, applicant, application in candidates:
+            keywords_data = corpus_results.get(application.detail_id)
+            if keywords_data:
+                top.push(score(keywords_data, rank), (applicant, application, keywords_data))
+        return top
+
+    matcher = ALGORITHMS.get(algo)
+    if matcher is None:
+        raise ValueError(f"Unknown algorithm: {algo}")
+    # Keywords are compiled once for the whole corpus, not once per CV
+    patterns = compile_patterns(keywords)
+
+    # Aho-Corasick ignores case, the other matchers do not; vocabulary tokens are lowercase
+    bounds = vocabulary.occurrence_bounds(keywords, case_sensitive=(algo != "Aho-Corasick"))
+    bounded = []
+    for rank, applicant, application in candidates:
+        distinct, total = bounds.get(application.detail_id, (0, 0))
+        if distinct:
+            bounded.append(((distinct, total, -rank), applicant, application))
+    bounded.sort(key=lambda candidate: candidate[0], reverse=True)
+
+    for bound, applicant, application in bounded:
+        if not top.admits(bound):
+            break
+        if control is not None and control.should_stop():
+            break
+        keywords_data = matcher(document_text(application.detail_id), patterns)
+        if keywords_data:
+            top.push(score(keywords_data, -bound[2]), (applicant, application, keywords_data))
+    return top
 
-    for applicant in applicants:
-        if (applicant_match_count >= top_match) and (top_match > 0):
-                break
-        applications = get_applications_by_applicant_id(applicant.applicant_id) # type: ignore
-        for application in applications:
-            results = []
-            cv_text = cv_data_text.get(application.detail_id, {}).get("cleaned_text", "")
-            if not cv_text:
-                continue
-            if algo == "Knuth-Morris-Pratt":
-                results = knuth_morris_pratt(cv_text, keywords)
-            elif algo == "Boyer-Moore":
-                results = boyer_moore(cv_text, keywords)
-            elif algo == "Aho-Corasick":
-                results = aho_corasick(cv_text, keywords)
-            else:
-                raise ValueError(f"Unknown algorithm: {algo}")
-            
-            if not results:
-                continue
+def search_matching_data(keywords: list[str], algo: str, top_match: int, control=None) -> dict:
+    """
+    Rank CVs against keywords. The exact phase keeps the top_match best CVs for algo;
+    the fuzzy phase fills the remaining slots with the best fuzzy matches among the other CVs.
+    top_match <= 0 returns every match. Keywords are stripped and repeats dropped before searching.
+    Repeated searches are served from query_cache.
+    While the warm-up runs, only the CVs loaded so far are searched; "coverage" reports how many.
+    control (a SearchControl) can cancel the search or stop it at a deadline, in which case
+    the results ranked so far are returned with "partial" set.
+    """
+    applicants_results = []
+    for batch in iter_search_matching_data(keywords, algo, top_match, control):
+        applicants_results.extend(batch["applicants"])
+    del batch["done"]
+    batch["applicants"] = applicants_results
+    return batch
 
-            applicant_match_count += 1
-            applicants_results.append({
-                "applicant_id": applicant.applicant_id,
-                "detail_id": application.detail_id,
-                "name": f"{applicant.first_name} {applicant.last_name}",
-                "matched_keywords": len(results),
-                "keywords_data": results,
-                "cv_path": application.cv_path,
-                "bgcolor": "#E3F2FD"  # Example background color
-            })
-            chosen_applications.add(application.detail_id)
-
-            if (applicant_match_count >= top_match) and (top_match > 0):
-                break
+def iter_search_matching_data(keywords: list[str], algo: str, top_match: int, control=None):
+    """
+    search_matching_data as a generator of result batches, so each phase is shown as soon as
+    it is ranked: first the exact matches, then the fuzzy ones. Every batch holds the stats so
+    far and only the new applicants, {"exact_match_stats", "fuzzy_match_stats", "coverage",
+    "partial", "applicants", "done"}; the last one has "done" set. index_lock is held per phase,
+    never while the caller handles a batch.
+    """
+    # The search runs on the same keywords its results are cached under
+    keywords = QueryCache.normalize_keywords(keywords)
+    cache_key = QueryCache.make_key(keywords, algo, top_match)
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        yield {**cached, "done": True}
+        return
+
+    if control is not None:
+        control.should_stop()  # a search cancelled while queued does not take the lock
+    with index_lock:
+        candidates = get_candidates()
+        curr_time = time.time()
+        exact_top = rank_exact_matches(candidates, keywords, algo, top_match, control)
+        exact_results = [make_result(*match) for match in exact_top.items()]
+        coverage = {
+            "ready": warm_up.ready,
+            "searched": len(indexed_ids),
+            "total": warm_up.total,
+        }
 
     exact_match_stats = {
-        "count": applicant_match_count,
+        "count": len(exact_results),
         "time_ms": int((time.time() - curr_time) * 1000)  # Convert to milliseconds
     }
+    fuzzy_match_stats = {"count": 0, "time_ms": 0}
+    remaining = top_match - len(exact_results) if top_match > 0 else 0
+    run_fuzzy = (top_match <= 0 or remaining > 0) and not (control is not None and control.should_stop())
+
+    def batch(applicants, done):
+        return {
+            "exact_match_stats": exact_match_stats,
+            "fuzzy_match_stats": fuzzy_match_stats,
+            "coverage": coverage,
+            "partial": control is not None and control.timed_out,
+            "applicants": applicants,
+            "done": done,
+        }
 
-    # Fuzzy matching
-    fuzzy_match_count = 0
-    curr_time = time.time()
-    for applicant in applicants:
-        if (applicant_match_count >= top_match) and (top_match > 0):
-            break
-        applications = get_applications_by_applicant_id(applicant.applicant_id) # type: ignore
-        for application in applications:
-            cv_text = cv_data_text.get(application.detail_id, {}).get("cleaned_text", "")
-            if not cv_text:
-                continue
+    fuzzy_results = []
+    if run_fuzzy:
+        yield batch(exact_results, False)
+
+        # Fuzzy matching: each distinct corpus token is scored once, occurrences come from the postings
+        curr_time = time.time()
+        chosen_applications = {result["detail_id"] for result in exact_results}
+        fuzzy_top = TopK(remaining)
+        with index_lock:
+            fuzzy_matches = vocabulary.fuzzy_search(keywords, should_stop=control.should_stop if control else None)
+            for rank, applicant, application in candidates:
+                if application.detail_id in chosen_applications:
+                    continue
+                keywords_data = fuzzy_matches.get(application.detail_id)
+                if keywords_data:
+                    fuzzy_top.push(score(keywords_data, rank), (applicant, application, keywords_data))
+        fuzzy_results = [make_result(*match) for match in fuzzy_top.items()]
+        fuzzy_match_stats = {
+            "count": len(fuzzy_results),
+            "time_ms": int((time.time() - curr_time) * 1000)  # Convert to milliseconds
+        }
 
-            if not application.detail_id or application.detail_id in chosen_applications: # type: ignore
-                continue
-            
-            results = fuzzy_match(cv_text, keywords)
+    last = batch(fuzzy_results if run_fuzzy else exact_results, True)
+    # Partial results are not cached: the next search covers more CVs or has more time
+    if coverage["ready"] and not last["partial"]:
+        results_data = {**last, "applicants": exact_results + fuzzy_results}
+        del results_data["done"]
+        query_cache.put(cache_key, results_data)
+    yield last
 
-            if not results:
-                continue
-            fuzzy_match_count += 1
-            applicants_results.append({
-                "applicant_id": applicant.applicant_id,
-                "name": f"{applicant.first_name} {applicant.last_name}",
-                "matched_keywords": len(results),
-                "keywords_data": results,
-                "cv_path": application.cv_path,
-                "bgcolor": "#E3F2FD"  # Example background color
-            })
-
-            if (applicant_match_count >= top_match) and (top_match > 0):
-                break
-    
-    fuzzy_match_stats = {
-        "count": fuzzy_match_count,
-        "time_ms": int((time.time() - curr_time) * 1000)  # Convert to milliseconds
-    }
 
-    results_data = {
-        "exact_match_stats": exact_match_stats,
-        "fuzzy_match_stats": fuzzy_match_stats,
-        "applicants": applicants_results
-    }
+# --- Asynchronous search ---
+
+class SearchCancelled(Exception):
+    """Raised inside a search that was cancelled, e.g. superseded by a newer one"""
 
-    return results_data
 
-            
-    # results_data = {
-    #     "exact_match_stats": {"count": 0, "time_ms": 0},
-    #     "fuzzy_match_stats": {"count": 0, "time_ms": 0},
-    #     "applicants": []
-    # }
\ No newline at end of file
+class SearchControl:
+    """
+    Cooperative cancellation and deadline of one search. The search calls should_stop() between
+    units of work: it raises SearchCancelled once cancel() has been called, and returns True once
+    the deadline has passed, so the search stops early with what it has ranked so far.
+    """
+    def __init__(self, deadline_seconds: float = None):
+        self.deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+        self.cancelled = threading.Event()
+        self.timed_out = False
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def should_stop(self) -> bool:
+        if self.cancelled.is_set():
+            raise SearchCancelled()
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.timed_out = True
+        return self.timed_out
+
+
+# Searches run here, off the UI event loop; a cancelled search may still be winding down
+# while the next one starts, hence two threads
+search_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search")
+current_search = None  # SearchControl of the search in flight
+
+async def stream_search_matching_data(keywords: list[str], algo: str, top_match: int, deadline_seconds: float = None):
+    """
+    iter_search_matching_data as an async iterator: each batch is computed in search_executor
+    and handed to the event loop as soon as it is ranked, so the exact matches can be shown
+    while the fuzzy phase runs. Starting another search cancels this one, its stream then ends.
+    """
+    global current_search
+    if current_search is not None:
+        current_search.cancel()
+    control = current_search = SearchControl(deadline_seconds)
+    batches = iter_search_matching_data(keywords, algo, top_match, control)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            batch = await loop.run_in_executor(search_executor, next, batches, None)
+            if batch is None or control.cancelled.is_set():
+                return
+            yield batch
+    except SearchCancelled:
+        return
+    except (asyncio.CancelledError, GeneratorExit):
+        control.cancel()
+        raise
+    finally:
+        if current_search is control:
+            current_search = None
@@ -0,0 +1,127 @@
+from bisect import bisect_left
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+
+# --- memory-mapped CV text store ---
+
+STORE_MAGIC = b"CVTS"
+STORE_VERSION = 1
+HEADER = struct.Struct("=4sIq")  # magic, format version, record count
+
+
+class TextStore:
+    """
+    CV texts in one memory-mapped file, stored by column. Layout after the header (native int64
+    columns, records sorted by detail_id): detail_ids[count], applicant_ids[count], offsets[count + 1],
+    then the UTF-8 blob. open() only maps the file and reads the header; the columns are views
+    over the mapping, lookups are a binary search on detail_ids and a text is decoded only when
+    it is read. The warm-up decodes every text once and builds the indexes and the corpus buffer
+    from it, so this saves the unpickling, not the memory the indexes take.
+    """
+    def __init__(self):
+        self.path = None
+        self.mm = None
+        self.detail_ids = ()
+        self.applicant_ids = ()
+        self.offsets = (0,)
+        self.data_start = 0
+
+    @classmethod
+    def open(cls, path: Path):
+        """Map a store written by write(), returns None when the file is missing or in another format"""
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < HEADER.size:
+                    return None
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return None
+        magic, version, count = HEADER.unpack_from(mm, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            mm.close()
+            return None
+
+        store = cls()
+        store.path = path
+        store.mm = mm
+        view = memoryview(mm)
+        columns_end = HEADER.size + 8 * (3 * count + 1)
+        table = view[HEADER.size:columns_end].cast('q')
+        store.detail_ids = table[:count]
+        store.applicant_ids = table[count:2 * count]
+        store.offsets = table[2 * count:]
+        store.data_start = columns_end
+        view.release()
+        return store
+
+    @staticmethod
+    def write(path: Path, records) -> None:
+        """
+        Write (detail_id, applicant_id, text) records to path. The file is written next to
+        path and moved over it, so a reader never sees a partially written store.
+        """
+        records = sorted(records, key=lambda record: record[0])
+        blobs = [text.encode('utf-8') for _, _, text in records]
+        offsets = array('q', [0])
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(STORE_MAGIC, STORE_VERSION, len(records)))
+            f.write(array('q', (record[0] for record in records)).tobytes())
+            f.write(array('q', (record[1] for record in records)).tobytes())
+            f.write(offsets.tobytes())
+            for blob in blobs:
+                f.write(blob)
+        os.replace(temp_path, path)
+
+    def __len__(self):
+        return len(self.detail_ids)
+
+    def __iter__(self):
+        """detail_ids in ascending order"""
+        return iter(self.detail_ids)
+
+    def find(self, detail_id) -> int:
+        """Position of detail_id in the columns, -1 if it is not stored"""
+        i = bisect_left(self.detail_ids, detail_id)
+        return i if i < len(self.detail_ids) and self.detail_ids[i] == detail_id else -1
+
+    def __contains__(self, detail_id):
+        return self.find(detail_id) >= 0
+
+    def applicant_id(self, detail_id):
+        i = self.find(detail_id)
+        return self.applicant_ids[i] if i >= 0 else None
+
+    def size(self, detail_id) -> int:
+        """Encoded length of one CV text, 0 if it is not stored"""
+        i = self.find(detail_id)
+        return self.offsets[i + 1] - self.offsets[i] if i >= 0 else 0
+
+    def text(self, detail_id, default: str = "") -> str:
+        """Decode the text of one CV from the mapped pages"""
+        i = self.find(detail_id)
+        return self._decode(i) if i >= 0 else default
+
+    def _decode(self, i: int) -> str:
+        return str(self.mm[self.data_start + self.offsets[i]:self.data_start + self.offsets[i + 1]], 'utf-8')
+
+    def items(self):
+        """(detail_id, text) for every stored CV"""
+        for i, detail_id in enumerate(self.detail_ids):
+            yield detail_id, self._decode(i)
+
+    def close(self):
+        """Release the column views and unmap the file"""
+        if self.mm is None:
+            return
+        for column in (self.detail_ids, self.applicant_ids, self.offsets):
+            column.release()
+        self.mm.close()
+        self.__init__()
@@ -1,13 +1,39 @@
 import fitz 
+import hashlib
+import os
+from core.regex import process_cv
+
+def read_pdf_text(pdf_path) -> str:
+    """Text of every page of a PDF, one newline after each page; raises on unreadable files"""
+    with fitz.open(pdf_path) as doc:
+        return "".join(page.get_text() + "\n" for page in doc)
 
 def extract_text_from_pdf(pdf_path):
-    text = ""
     print(f"Mengekstrak teks dari {pdf_path}...")
     try:
-        with fitz.open(pdf_path) as doc:
-            for page in doc:
-                text += page.get_text() + "\n"
-        return text
+        return read_pdf_text(pdf_path)
     except Exception as e:
         print(f"Error saat mengekstrak teks dari {pdf_path}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+def file_sha1(path) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def extract_cv_entry(cv_path) -> dict:
+    """
+    Extraction cache entry of one CV: {"size", "mtime", "sha1", "cv_text", "parsed"}
+    with the lowercased text and its process_cv parse
+    """
+    stat = os.stat(cv_path)
+    cv_text = read_pdf_text(cv_path).lower()
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "sha1": file_sha1(cv_path),
+        "cv_text": cv_text,
+        "parsed": process_cv(cv_text),
+    }
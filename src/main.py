@@ -14,7 +14,8 @@ def main(page: ft.Page):
         # "Freeman": "/fonts/Freeman/Freeman-Regular.ttf",
     }
 
-    service.extract_all_cv_data() 
+    # CVs are loaded in the background; the window is usable while they are indexed
+    service.start_warm_up()
 
     def route_change(route):
         page.views.clear()
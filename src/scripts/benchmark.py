@@ -0,0 +1,422 @@
+import sys
+sys.path.append("src")
+
+import argparse
+import pickle
+import re
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from core.index import BKTree, build_vocabulary, build_inverted_index
+from core.corpus import Corpus, SharedCorpus
+from core.parallel import SearchPool, FUZZY
+from core.store import TextStore
+from core.regex import segment_sections, process_cv
+from core.algorithm import (
+    aho_corasick, automaton_cache, knuth_morris_pratt, boyer_moore, BM_VARIANTS, PatternSet,
+    fuzzy_match, FUZZY_BACKENDS, levenshtein_distance, myers_similarity, search_texts,
+)
+
+TEXT_STORE_FILE = Path("data/cache/cv_texts.bin")
+DEFAULT_KEYWORDS = [
+    "python", "java", "sql", "excel", "management", "accounting", "react", "html",
+    "css", "javascript", "marketing", "sales", "customer service", "leadership",
+    "communication", "project management", "microsoft office", "budget", "training", "data analysis",
+]
+
+
+def load_corpus(limit: int = 0) -> list[str]:
+    """
+    Load the lowercase CV texts used by the search, newlines kept.
+    Uses the text store when present, otherwise extracts every PDF under data/.
+    """
+    store = TextStore.open(TEXT_STORE_FILE)
+    if store is not None:
+        texts = [cv_text for _, cv_text in store.items()]
+        store.close()
+    else:
+        from core.utils import extract_text_from_pdf
+        texts = []
+        for pdf_path in sorted(Path("data").glob("*/*.pdf")):
+            cv_text = extract_text_from_pdf(pdf_path)
+            if cv_text:
+                texts.append(cv_text.lower())
+    return texts[:limit] if limit > 0 else texts
+
+
+def timed(func, repeat: int):
+    """Return (best seconds over repeat runs, result of the last run)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_row(name: str, seconds: float, baseline: float):
+    print(f"  {name:<32} {seconds * 1000:>10.1f} ms   x{baseline / seconds:>5.2f}")
+
+
+# --- Benchmarks ---
+
+def bench_aho_corasick(texts: list[str], keywords: list[str], repeat: int):
+    """Object-graph trie vs array-backed DFA, one aho_corasick() call per CV"""
+    print("Aho-Corasick engines")
+    baseline = None
+    expected = None
+    for engine in ("trie", "dfa"):
+        automaton_cache.get(keywords, engine)  # compile outside the timed region
+        seconds, result = timed(lambda: [aho_corasick(text, keywords, engine) for text in texts], repeat)
+        if expected is None:
+            baseline, expected = seconds, result
+        elif result != expected:
+            raise AssertionError(f"Aho-Corasick engine '{engine}' disagrees with 'trie'")
+        print_row(engine, seconds, baseline)
+
+    corpus = Corpus(dict(enumerate(texts)))
+    seconds, by_document = timed(lambda: corpus.aho_corasick(keywords), repeat)
+    if [by_document.get(i, []) for i in range(len(texts))] != expected:
+        raise AssertionError("Single-pass corpus scan disagrees with 'trie'")
+    print_row("dfa, single corpus pass", seconds, baseline)
+
+
+def bench_boyer_moore(texts: list[str], keywords: list[str], repeat: int):
+    """KMP baseline vs each Boyer-Moore variant, with keywords compiled once"""
+    print("Boyer-Moore variants")
+    patterns = PatternSet(keywords)
+    baseline, expected = timed(lambda: [knuth_morris_pratt(text, patterns) for text in texts], repeat)
+    print_row("knuth-morris-pratt", baseline, baseline)
+    for variant in BM_VARIANTS:
+        seconds, result = timed(lambda: [boyer_moore(text, patterns, variant) for text in texts], repeat)
+        if result != expected:
+            raise AssertionError(f"Boyer-Moore variant '{variant}' disagrees with KMP")
+        print_row(f"boyer-moore ({variant})", seconds, baseline)
+
+
+def bench_fuzzy(texts: list[str], keywords: list[str], repeat: int):
+    """Full DP matrix vs the other fuzzy_match backends, one call per CV"""
+    print("Fuzzy match backends")
+    baseline, expected = timed(lambda: [fuzzy_match(text, keywords, backend="dp") for text in texts], repeat)
+    print_row("dp", baseline, baseline)
+    for backend in FUZZY_BACKENDS:
+        if backend == "dp":
+            continue
+        seconds, result = timed(lambda: [fuzzy_match(text, keywords, backend=backend) for text in texts], repeat)
+        if result != expected:
+            raise AssertionError(f"Fuzzy backend '{backend}' disagrees with 'dp'")
+        print_row(backend, seconds, baseline)
+
+    documents = dict(enumerate(texts))
+    vocabulary = build_vocabulary(documents)
+    seconds, by_document = timed(lambda: vocabulary.fuzzy_search(keywords), repeat)
+    if [by_document.get(i, []) for i in documents] != expected:
+        raise AssertionError("Vocabulary fuzzy search disagrees with 'dp'")
+    print_row(f"vocabulary ({len(vocabulary)} tokens)", seconds, baseline)
+
+    vocabulary.bktree = BKTree()
+    vocabulary.bktree.update(vocabulary.postings)
+    seconds, by_document = timed(lambda: vocabulary.fuzzy_search(keywords), repeat)
+    if [by_document.get(i, []) for i in documents] != expected:
+        raise AssertionError("BK-tree fuzzy search disagrees with 'dp'")
+    print_row("vocabulary + bk-tree", seconds, baseline)
+
+
+def bench_edit_distance(texts: list[str], keywords: list[str], repeat: int):
+    """Parity and throughput of myers_similarity against levenshtein_distance on (corpus word, keyword) pairs"""
+    print("Edit distance engines")
+    words = [word for text in texts for word in text.split()][:20000]
+    pairs = [(word, keyword.lower()) for word in words for keyword in keywords]
+    baseline, expected = timed(lambda: [levenshtein_distance(a, b) for a, b in pairs], repeat)
+    seconds, result = timed(lambda: [myers_similarity(a, b) for a, b in pairs], repeat)
+    mismatches = sum(1 for x, y in zip(expected, result) if x != y)
+    if mismatches:
+        raise AssertionError(f"myers_similarity differs from levenshtein_distance on {mismatches} pairs")
+    print(f"  {len(pairs)} pairs, identical percentages")
+    print_row(f"dp ({len(pairs) / baseline:,.0f} pairs/s)", baseline, baseline)
+    print_row(f"myers ({len(pairs) / seconds:,.0f} pairs/s)", seconds, baseline)
+
+
+def bench_inverted_index(texts: list[str], keywords: list[str], repeat: int):
+    """Whole-word lookups from the inverted index vs a full Aho-Corasick rescan of every CV"""
+    print("Inverted index")
+    baseline, _ = timed(lambda: [aho_corasick(text, keywords) for text in texts], repeat)
+    print_row("aho-corasick rescan", baseline, baseline)
+    build, index = timed(lambda: build_inverted_index(dict(enumerate(texts))), 1)
+    print(f"  build: {build * 1000:.1f} ms, {len(index)} tokens")
+    seconds, _ = timed(lambda: index.search(keywords), repeat)
+    print_row("inverted index lookup", seconds, baseline)
+
+
+def bench_parallel(texts: list[str], keywords: list[str], repeat: int):
+    """Single process vs the warm process pool, per algorithm"""
+    documents = dict(enumerate(texts))
+    shared = SharedCorpus.create(documents)
+    pool = SearchPool(shared)
+    print(f"Parallel search ({pool.workers} workers, {len(pool.shards)} shards)")
+    try:
+        for algo in ("Knuth-Morris-Pratt", "Boyer-Moore", "Aho-Corasick", FUZZY):
+            if algo == FUZZY:
+                serial = lambda: {i: r for i, r in ((i, fuzzy_match(t, keywords)) for i, t in documents.items()) if r}
+            else:
+                serial = lambda: {i: r for i, r in search_texts(documents.items(), keywords, algo) if r}
+            baseline, expected = timed(serial, repeat)
+            seconds, result = timed(lambda: pool.search(keywords, algo), repeat)
+            if result != expected:
+                raise AssertionError(f"Parallel {algo} disagrees with the single process search")
+            print_row(f"{algo} (1 process)", baseline, baseline)
+            print_row(f"{algo} (pool)", seconds, baseline)
+    finally:
+        pool.shutdown()
+        shared.close()
+
+
+def bench_text_store(texts: list[str], keywords: list[str], repeat: int):
+    """
+    Cost of unpickling every CV text vs mapping the text store, one full read of each, and the
+    whole startup path (texts plus vocabulary, inverted index and corpus buffer) from each
+    """
+    print("Text store")
+    records = [(i, i, text) for i, text in enumerate(texts)]
+    with tempfile.TemporaryDirectory() as directory:
+        pickle_path = Path(directory) / "cv_data_cache.pkl"
+        store_path = Path(directory) / "cv_texts.bin"
+        with open(pickle_path, 'wb') as f:
+            pickle.dump({i: {"applicant_id": i, "cv_text": text} for i, _, text in records}, f)
+        TextStore.write(store_path, records)
+
+        def load_pickle():
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)
+
+        def measure(load):
+            tracemalloc.start()
+            loaded = load()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return loaded, peak
+
+        baseline, data = timed(load_pickle, repeat)
+        _, peak = measure(load_pickle)
+        print_row(f"pickle load ({peak / 2**20:.1f} MiB peak)", baseline, baseline)
+
+        seconds, store = timed(lambda: TextStore.open(store_path), repeat)
+        store, peak = measure(lambda: TextStore.open(store_path))
+        print_row(f"mmap open ({peak / 2**20:.3f} MiB peak)", seconds, baseline)
+        if [text for _, text in store.items()] != [data[i]["cv_text"] for i in data]:
+            raise AssertionError("Text store disagrees with the pickle")
+        seconds, _ = timed(lambda: [text for _, text in store.items()], repeat)
+        print_row("mmap read every text", seconds, baseline)
+        store.close()
+
+        # The startup path of the warm-up: load the texts, then build the vocabulary, the
+        # inverted index and the corpus buffer from them. tracemalloc counts the Python heap,
+        # the mapped pages of the store are not included
+        def start_from_pickle():
+            documents = {i: entry["cv_text"] for i, entry in load_pickle().items()}
+            return build_vocabulary(documents), build_inverted_index(documents), Corpus(documents)
+
+        def start_from_store():
+            # Like the warm-up, every text is decoded once and reused for the indexes and the corpus
+            store = TextStore.open(store_path)
+            documents = dict(store.items())
+            store.close()
+            return build_vocabulary(documents), build_inverted_index(documents), Corpus(documents)
+
+        baseline, _ = timed(start_from_pickle, repeat)
+        _, peak = measure(start_from_pickle)
+        print_row(f"startup, pickle ({peak / 2**20:.1f} MiB peak)", baseline, baseline)
+        seconds, _ = timed(start_from_store, repeat)
+        _, peak = measure(start_from_store)
+        print_row(f"startup, mmap ({peak / 2**20:.1f} MiB peak)", seconds, baseline)
+
+
+# Block extraction of process_cv before the single-pass segmenter, kept as the parity reference
+LEGACY_SECTION_PATTERNS = {
+    "experience": r"(?i)(?:Experience|Professional Experience|Work Experience)\b([\s\S]*?)(?=\n(?:Education|Skills|Highlights|Projects|Qualifications|Accomplishments|Awards)\b|\Z)",
+    "education": r"(?i)(?:Education|Education and Training)\b([\s\S]*?)(?=\n(?:Experience|Skills|Highlights|Projects|Qualifications|Accomplishments|Awards)\b|\Z)",
+    "skills": r"(?i)(?:Skills|Highlights)\b([\s\S]*?)(?=\n(?:Experience|Education|Projects|Qualifications|Accomplishments|Awards)\b|\Z)",
+}
+
+def legacy_sections(full_text: str) -> dict:
+    blocks = {}
+    for section, pattern in LEGACY_SECTION_PATTERNS.items():
+        match = re.search(pattern, full_text)
+        blocks[section] = match.group(1) if match else None
+    return blocks
+
+
+def bench_regex(texts: list[str], keywords: list[str], repeat: int):
+    """Single-pass section segmenter vs the three lazy section regexes: parity, and time as CVs grow"""
+    print("CV section segmenter")
+    # Headings in both cases and positions, including the edge cases of the old patterns
+    samples = list(texts) + [
+        "",
+        "no headings at all",
+        "Experience\nSkills",
+        "Skills\nExperience\nEducation\nAwards",
+        "Work Experience\nengineer\nEducation and Training\nB.S 2019\nHighlights\npython, sql",
+        "inexperienced\nskillset\nexperience: 5 years\n  skills indented\nskills\nsql\nEDUCATION\nbachelor 2010",
+        "highlights\nfoo\nskills\nbar\neducation",
+    ]
+    samples += [text.title() for text in texts[:20]]
+    mismatches = sum(1 for text in samples if segment_sections(text) != legacy_sections(text))
+    if mismatches:
+        raise AssertionError(f"segment_sections differs from the section regexes on {mismatches} texts")
+    print(f"  {len(samples)} texts, identical blocks")
+
+    baseline, _ = timed(lambda: [legacy_sections(text) for text in texts], repeat)
+    print_row("section regexes", baseline, baseline)
+    seconds, _ = timed(lambda: [segment_sections(text) for text in texts], repeat)
+    print_row("single-pass segmenter", seconds, baseline)
+    seconds, _ = timed(lambda: [process_cv(text) for text in texts], repeat)
+    print_row("process_cv (segmenter + parsers)", seconds, baseline)
+
+    # Long CVs whose sections run to the end of the text, so every scan covers all of it:
+    # time per character should stay flat as the text grows
+    body = " ".join(" ".join(text.split()) for text in texts[:5]) or "lorem ipsum"
+    for factor in (1, 4, 16, 64):
+        long_text = f"skills\n{body}\nexperience\n{body * factor}\neducation\n{body * factor}"
+        legacy, _ = timed(lambda: legacy_sections(long_text), repeat)
+        single, _ = timed(lambda: segment_sections(long_text), repeat)
+        print(f"  {len(long_text):>10} chars   regexes {legacy * 1e9 / len(long_text):>6.1f} ns/char"
+              f"   segmenter {single * 1e9 / len(long_text):>6.1f} ns/char")
+
+
+def bench_render(texts: list[str], keywords: list[str], repeat: int):
+    """
+    Results panel, before and after pagination: a card built and sent for every result vs one
+    page of pooled cards, for a first search and for the next one. Each render is timed with its
+    page.update(), which turns the control tree into flet commands and encodes them as JSON.
+    """
+    import asyncio
+    import json
+    import flet as ft  # only this benchmark needs the UI toolkit
+    from flet.core.local_connection import LocalConnection
+    from flet.core.protocol import ClientActions, ClientMessage, CommandEncoder, PageCommandsBatchResponsePayload
+    from components.results import Results, RESULTS_PAGE_SIZE
+    from components.result_card import ResultCard
+
+    class SerializingConnection(LocalConnection):
+        """flet's own command processing and JSON encoding of every update, with no client to send to"""
+        def __init__(self):
+            super().__init__()
+            self.sent = 0  # bytes encoded so far
+
+        def send_commands(self, session_id, commands):
+            results, messages = [], []
+            for command in commands:
+                result, message = self._process_command(command)
+                if command.name in ("add", "get"):
+                    results.append(result)
+                if message:
+                    messages.append(message)
+            if messages:
+                message = ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, messages)
+                self.sent += len(json.dumps(message, cls=CommandEncoder, separators=(",", ":")))
+            return PageCommandsBatchResponsePayload(results=results, error="")
+
+    print("Results rendering")
+
+    def results_data(offset):
+        # One result per CV with the keywords it contains, like a top_match as large as the corpus
+        applicants = []
+        for i, text in enumerate(texts):
+            keywords_data = [{"keyword": k, "occurrences": text.count(k)} for k in keywords if k in text]
+            applicants.append({
+                "applicant_id": i + offset, "detail_id": i + offset, "name": f"Applicant {i + offset}",
+                "matched_keywords": len(keywords_data), "keywords_data": keywords_data, "cv_path": "",
+            })
+        return {"exact_match_stats": {"count": len(applicants), "time_ms": 0},
+                "fuzzy_match_stats": {"count": 0, "time_ms": 0}, "applicants": applicants}
+
+    first, second = results_data(0), results_data(1)
+    count = len(first["applicants"])
+    if not count:
+        return
+
+    def every_card(results, data):
+        # Results.show_results before pagination: every card and row built and sent up front
+        rows = []
+        for i in range(0, len(data["applicants"]), 4):
+            cards = []
+            for applicant in data["applicants"][i:i + 4]:
+                card = ResultCard(**{key: applicant[key] for key in (
+                    "applicant_id", "detail_id", "name", "matched_keywords", "keywords_data", "cv_path")},
+                    bgcolor=results.calculate_color(applicant["applicant_id"], i))
+                card.container.expand = True
+                cards.append(card.container)
+            rows.append(ft.Row(controls=cards, spacing=15, alignment=ft.MainAxisAlignment.START))
+        results.container.content.controls[2].content.controls = rows
+        results.container.visible = True
+
+    def one_page(results, data):
+        results.show_results(data)
+
+    loop = asyncio.new_event_loop()
+
+    def measure(render, searches):
+        """Best time and encoded size of the last search's render plus page.update()"""
+        best, sent = float('inf'), 0
+        for _ in range(repeat):
+            connection = SerializingConnection()
+            page = ft.Page(connection, "benchmark", loop)
+            results = Results()
+            page.add(results.container)
+            for data in searches[:-1]:
+                render(results, data)
+                page.update()
+            before = connection.sent
+            start = time.perf_counter()
+            render(results, searches[-1])
+            page.update()
+            best = min(best, time.perf_counter() - start)
+            sent = connection.sent - before
+        return best, sent
+
+    def row(name, seconds, sent, cards, baseline):
+        print(f"  {name:<34} {seconds * 1000:>8.1f} ms {seconds * 1e5 / cards:>7.2f} ms/100 cards"
+              f" {sent / 1024:>8.1f} KiB   x{baseline / seconds:>5.2f}")
+
+    page_cards = min(count, RESULTS_PAGE_SIZE)
+    baseline, sent = measure(every_card, [first])
+    row(f"first search, every card ({count})", baseline, sent, count, baseline)
+    seconds, sent = measure(one_page, [first])
+    row(f"first search, one page ({page_cards})", seconds, sent, page_cards, baseline)
+    baseline, sent = measure(every_card, [first, second])
+    row(f"next search, every card ({count})", baseline, sent, count, baseline)
+    seconds, sent = measure(one_page, [first, second])
+    row(f"next search, reused ({page_cards})", seconds, sent, page_cards, baseline)
+    loop.close()
+
+BENCHMARKS = {
+    "aho-corasick": bench_aho_corasick,
+    "boyer-moore": bench_boyer_moore,
+    "fuzzy": bench_fuzzy,
+    "edit-distance": bench_edit_distance,
+    "inverted-index": bench_inverted_index,
+    "parallel": bench_parallel,
+    "text-store": bench_text_store,
+    "regex": bench_regex,
+    "render": bench_render,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CV matching algorithms on the data/ corpus.")
+    parser.add_argument("benchmarks", nargs="*", choices=[[], *BENCHMARKS], help="benchmarks to run (default: all)")
+    parser.add_argument("--keywords", help="comma separated keywords")
+    parser.add_argument("--limit", type=int, default=0, help="only use the first N CVs")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    keywords = [k.strip() for k in args.keywords.split(',') if k.strip()] if args.keywords else DEFAULT_KEYWORDS
+    texts = load_corpus(args.limit)
+    print(f"Corpus: {len(texts)} CVs, {sum(map(len, texts))} characters, {len(keywords)} keywords\n")
+
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name](texts, keywords, args.repeat)
+        print()
@@ -1,7 +1,14 @@
 import flet as ft
 from components.search_configuration import SearchConfiguration
 from components.results import Results
-from core.service import search_matching_data
+from core.service import stream_search_matching_data, warm_up
+
+# Searches running longer than this stop and show the results ranked so far
+SEARCH_DEADLINE_SECONDS = 10
+# Distance from the bottom of the page, in pixels, at which the next page of results is rendered
+SCROLL_LOAD_MARGIN = 300
+# Warm-up listener of the home view currently built
+warm_up_listener = None
 
 def home_view(page: ft.Page):
 
@@ -15,25 +22,76 @@ def home_view(page: ft.Page):
 
     results = Results(on_summary_click=on_summary_click)
 
-    def on_search_callback(search_data):
+    async def on_search_callback(search_data):
         """I.S. search_data contains:
             keywords (list of string), 
-            algorithm ("Knuth-Morris-Pratt", "Boyer-Moore", or "Aho-Corasick"), 
+            algorithm ("Knuth-Morris-Pratt", "Boyer-Moore", "Aho-Corasick", or "Inverted-Index"), 
             and top_matches (int)"""
 
         # print(f"Search data: {search_data}")
-        results_data = search_matching_data(
+        # Batches stream in as each phase is ranked: exact matches first, fuzzy ones after.
+        # A search superseded by a newer one just stops streaming
+        first_batch = True
+        async for results_data in stream_search_matching_data(
             keywords=search_data["keywords"],
             algo=search_data["algorithm"],
-            top_match=int(search_data["top_matches"])
-        )
-        
-        # Show results with sample data for now
-        # results.show_results()
-        results.show_results(results_data)  # Use this when you have real data
-        page.update()
+            top_match=int(search_data["top_matches"]),
+            deadline_seconds=SEARCH_DEADLINE_SECONDS,
+        ):
+            if first_batch:
+                results.clear_results()
+                first_batch = False
+            results.append_results(results_data, done=results_data["done"])
+            page.update()
     
     search_config = SearchConfiguration(on_search_callback=on_search_callback)
+
+    # Warm-up status, shown until every CV is searchable
+    warm_up_text = ft.Text("", size=14, color="#424242")
+    warm_up_bar = ft.ProgressBar(value=None, color="#4A90E2", bgcolor="#E3F2FD")
+    warm_up_status = ft.Container(
+        content=ft.Column([warm_up_text, warm_up_bar], spacing=8),
+        padding=ft.padding.all(15),
+        bgcolor="#FFFFFF",
+        border_radius=8,
+        border=ft.border.only(left=ft.BorderSide(4, "#4A90E2")),
+        visible=False,
+    )
+
+    def show_warm_up(status):
+        """Listener on the service warm-up, called from its thread"""
+        if status["state"] == "failed":
+            warm_up_text.value = f"Loading CVs failed: {status['error']}"
+            warm_up_bar.visible = False
+        elif status["ready"]:
+            warm_up_status.visible = False
+            warm_up.remove_listener(show_warm_up)
+        else:
+            total = status["total"]
+            warm_up_text.value = (
+                f"Loading CVs: {status['searchable']} of {total} searchable..." if total else "Loading CVs..."
+            )
+            warm_up_bar.value = status["done"] / total if total else None
+            warm_up_status.visible = True
+        # A control can only be updated once it is on the page
+        if warm_up_status.page:
+            warm_up_status.update()
+
+    def on_scroll(e: ft.OnScrollEvent):
+        """Render the next page of results when scrolled near the bottom"""
+        if e.pixels >= e.max_scroll_extent - SCROLL_LOAD_MARGIN and results.has_more():
+            results.load_more()
+            results.container.update()
+
+    # Each route change back to "/" builds a new home view; only the latest one listens
+    global warm_up_listener
+    if warm_up_listener is not None:
+        warm_up.remove_listener(warm_up_listener)
+        warm_up_listener = None
+    if not warm_up.ready:
+        show_warm_up(warm_up.snapshot())
+        warm_up.add_listener(show_warm_up)
+        warm_up_listener = show_warm_up
     
     return ft.Container(
         content=ft.Column([
@@ -57,6 +115,8 @@ def home_view(page: ft.Page):
                 alignment=ft.alignment.center,
                 padding=ft.padding.only(bottom=20),
             ),
+            warm_up_status,
+
             # Search configuration
             search_config.container,
 
@@ -64,7 +124,9 @@ def home_view(page: ft.Page):
             results.container,
 
         ], spacing=20,
-        scroll=ft.ScrollMode.AUTO),
+        scroll=ft.ScrollMode.AUTO,
+        on_scroll=on_scroll,
+        on_scroll_interval=100),
         alignment=ft.alignment.top_center,
         padding=20,
         expand=True,